@@ -3,20 +3,15 @@
 Example usage of the GitHub Audit Tool as a library
 """
 
-import os
 from datetime import datetime, timedelta
-from github_audit_tool import GitHubAuditTool
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from github_audit_tool import GitHubAuditTool, get_env
 
 def main():
     """Example of using the GitHub Audit Tool programmatically."""
     
-    # Get API keys from environment
-    github_token = os.getenv('GITHUB_TOKEN')
-    openai_api_key = os.getenv('OPENAI_API_KEY')
+    # Get API keys from the environment or .env file
+    github_token = get_env('GITHUB_TOKEN')
+    openai_api_key = get_env('OPENAI_API_KEY')
     
     if not github_token or not openai_api_key:
         print("Error: Please set GITHUB_TOKEN and OPENAI_API_KEY in your .env file")
@@ -52,8 +47,9 @@ def main():
             
             # Generate changelist
             print("🤖 Generating AI changelist...")
-            diffs = audit_tool.get_commit_diffs(commits)
-            changelist = audit_tool.generate_changelist_with_ai(diffs, yesterday)
+            # Per-commit diffs are fetched concurrently (one request per commit)
+            diffs, _ = audit_tool.get_commit_diffs(commits)
+            changelist = audit_tool.generate_changelist_with_ai(diffs, (yesterday, yesterday))
             
             # Save to file
             filename = f"changelist_{yesterday.strftime('%Y-%m-%d')}.txt"
@@ -9,16 +9,73 @@ from tkinter import ttk, scrolledtext, filedialog, messagebox
 import threading
 import sys
 import os
+import io
+import codecs
+import queue
+import functools
+from collections import deque
+from contextlib import redirect_stdout, redirect_stderr
+from dataclasses import dataclass
 from datetime import datetime
-import subprocess
-import json
 from pathlib import Path
 
-# Import the main audit tool class
-from github_audit_tool import GitHubAuditTool, validate_environment
+# Maximum number of lines kept in the output area
+MAX_OUTPUT_LINES = 10000
+
+# Options accepted by each action, mirroring the CLI commands
+_FILTER_OPTIONS = {'--date', '--author', '--min-commit', '--max-commit'}
+_AI_REPORT_OPTIONS = _FILTER_OPTIONS | {'--output', '--format', '--voice', '--verbose', '--display-only'}
+_REPORT_OPTIONS = _FILTER_OPTIONS | {'--output', '--format', '--save'}
+ACTION_OPTIONS = {
+    'changelist': _AI_REPORT_OPTIONS,
+    'timeline': _AI_REPORT_OPTIONS,
+    'hours': _REPORT_OPTIONS,
+    'rhythm': _REPORT_OPTIONS,
+    'stats': _REPORT_OPTIONS,
+    'info': _FILTER_OPTIONS,
+    'setup': set(),
+}
+
+@dataclass
+class RunArgs:
+    """Snapshot of the form inputs taken when an action is started."""
+    repo: str
+    date: str
+    author: str
+    min_sha: str
+    max_sha: str
+    output: str
+    voice: str
+    fmt: str
+    verbose: bool
+    display_only: bool
+    save: bool
+
+class QueueWriter(io.TextIOBase):
+    """Text stream that forwards everything written to it onto a queue."""
+    
+    encoding = 'utf-8'
+    
+    def __init__(self, output_queue):
+        super().__init__()
+        self.output_queue = output_queue
+    
+    def writable(self):
+        return True
+    
+    def write(self, text):
+        # Reject bytes so click treats this as a text stream
+        if not isinstance(text, str):
+            raise TypeError("QueueWriter only accepts text")
+        if text:
+            self.output_queue.put(text)
+        return len(text)
+    
+    def isatty(self):
+        return False
 
 class GitHubAuditGUI:
-    def __init__(self, root):
+    def __init__(self, root, legacy=False):
         self.root = root
         self.root.title("GitHub Auditing Tool")
         self.root.geometry("1000x700")
@@ -30,11 +87,32 @@ class GitHubAuditGUI:
         # Variables
         self.setup_variables()
         
+        # Output produced by running actions, drained on the Tk thread
+        self.output_queue = queue.Queue()
+        
+        # Pending text for the output area, flushed in batches by _flush_log
+        self._log_queue = deque()
+        self._log_pending = False
+        
+        # Shared audit tool for in-process actions (created by check_environment)
+        self.audit_tool = None
+        self._env_ok = False
+        
+        # Long-lived worker process for actions that run isolated from the GUI;
+        # with legacy=True every such action starts its own subprocess instead
+        self.legacy = legacy
+        self.worker = None
+        
         # Create GUI
         self.create_widgets()
         
-        # Check environment on startup
-        self.check_environment()
+        # Check environment once the window has painted; this is what first
+        # imports the audit tool (PyGithub, OpenAI, tiktoken are slow to load),
+        # so it runs on a background thread. main() flushes idle callbacks
+        # before the first draw, hence a timer rather than after_idle
+        self.root.after(100, self.check_environment)
+        if not self.legacy:
+            self.root.after_idle(self.start_worker)
     
     def setup_styles(self):
         """Setup modern styling for the GUI."""
@@ -210,17 +288,17 @@ class GitHubAuditGUI:
         
         # Main action buttons
         changelist_btn = ttk.Button(button_frame1, text="Generate Changelist", 
-                                  command=lambda: self.run_command('changelist'),
+                                  command=functools.partial(self.run_command, 'changelist'),
                                   style='Action.TButton', width=20)
         changelist_btn.grid(row=0, column=0, padx=(0, 10))
         
         timeline_btn = ttk.Button(button_frame1, text="Generate Timeline", 
-                                command=lambda: self.run_command('timeline'),
+                                command=functools.partial(self.run_command, 'timeline'),
                                 style='Action.TButton', width=20)
         timeline_btn.grid(row=0, column=1, padx=(0, 10))
         
         stats_btn = ttk.Button(button_frame1, text="Generate Statistics", 
-                             command=lambda: self.run_command('stats'),
+                             command=functools.partial(self.run_command, 'stats'),
                              style='Action.TButton', width=20)
         stats_btn.grid(row=0, column=2, padx=(0, 10))
         
@@ -229,22 +307,22 @@ class GitHubAuditGUI:
         button_frame2.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
         hours_btn = ttk.Button(button_frame2, text="Calculate Hours", 
-                             command=lambda: self.run_command('hours'),
+                             command=functools.partial(self.run_command, 'hours'),
                              style='Action.TButton', width=20)
         hours_btn.grid(row=0, column=0, padx=(0, 10))
         
         rhythm_btn = ttk.Button(button_frame2, text="Analyze Rhythm", 
-                              command=lambda: self.run_command('rhythm'),
+                              command=functools.partial(self.run_command, 'rhythm'),
                               style='Action.TButton', width=20)
         rhythm_btn.grid(row=0, column=1, padx=(0, 10))
         
         info_btn = ttk.Button(button_frame2, text="Show Commit Info", 
-                            command=lambda: self.run_command('info'),
+                            command=functools.partial(self.run_command, 'info'),
                             style='Action.TButton', width=20)
         info_btn.grid(row=0, column=2, padx=(0, 10))
         
         setup_btn = ttk.Button(button_frame2, text="Setup API Keys", 
-                             command=lambda: self.run_command('setup'),
+                             command=functools.partial(self.run_command, 'setup'),
                              style='Primary.TButton', width=20)
         setup_btn.grid(row=0, column=3, padx=(10, 0))
         
@@ -264,9 +342,18 @@ class GitHubAuditGUI:
                                                    height=15)
         self.output_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
-        # Clear button
-        clear_btn = ttk.Button(output_frame, text="Clear Output", command=self.clear_output)
-        clear_btn.grid(row=1, column=0, sticky=tk.E, pady=(10, 0))
+        # Output buttons
+        output_buttons = ttk.Frame(output_frame)
+        output_buttons.grid(row=1, column=0, sticky=tk.E, pady=(10, 0))
+        
+        clear_cache_btn = ttk.Button(output_buttons, text="Clear Cache", command=self.clear_cache)
+        clear_cache_btn.grid(row=0, column=0, padx=(0, 10))
+        
+        # Clearing restarts the worker, so it is disabled while an action runs
+        self.action_buttons.append(clear_cache_btn)
+        
+        clear_btn = ttk.Button(output_buttons, text="Clear Output", command=self.clear_output)
+        clear_btn.grid(row=0, column=1)
     
     def create_status_bar(self, parent):
         """Create the status bar."""
@@ -296,19 +383,49 @@ class GitHubAuditGUI:
         if filename:
             self.output_var.set(filename)
     
+    def tool_module(self):
+        """Return the github_audit_tool module, importing it on first use."""
+        if not hasattr(self, '_tool_mod'):
+            import github_audit_tool
+            self._tool_mod = github_audit_tool
+        return self._tool_mod
+    
     def check_environment(self):
-        """Check if environment variables are set."""
+        """Check if environment variables are set, loading the audit tool on a background thread."""
+        if self._env_ok:
+            return
+        
+        threading.Thread(target=self._load_audit_tool, daemon=True).start()
+    
+    def _load_audit_tool(self):
+        """Import the audit tool module and create the shared tool, then report back on the Tk thread."""
+        credentials = audit_tool = error = tool_error = None
         try:
-            validation_result = validate_environment()
-            if validation_result:
-                self.status_var.set("Environment OK - API keys configured")
-                self.log_output("✓ API keys are configured and ready to use.\n")
-            else:
-                self.status_var.set("Environment Error - API keys missing")
-                self.log_output("⚠ Missing API keys. Please use 'Setup API Keys' to configure.\n")
+            credentials = self.tool_module().validate_environment()
+            if credentials is not None:
+                try:
+                    audit_tool = self.tool_module().GitHubAuditTool(*credentials)
+                except Exception as e:
+                    tool_error = e
         except Exception as e:
-            self.status_var.set(f"Environment Error: {str(e)}")
-            self.log_output(f"❌ Environment check failed: {str(e)}\n")
+            error = e
+        self.root.after(0, self._environment_checked, credentials, audit_tool, error, tool_error)
+    
+    def _environment_checked(self, credentials, audit_tool, error, tool_error):
+        """Show the result of the environment check and install the shared tool for in-process actions."""
+        if error is not None:
+            self.status_var.set(f"Environment Error: {str(error)}")
+            self.log_output(f"❌ Environment check failed: {str(error)}\n")
+        elif credentials is not None:
+            self.status_var.set("Environment OK - API keys configured")
+            self.log_output("✓ API keys are configured and ready to use.\n")
+            if tool_error is not None:
+                self.log_output(f"⚠ Could not initialize audit tool, actions will run as subprocesses: {str(tool_error)}\n")
+            self.audit_tool = audit_tool
+            self._env_ok = True
+        else:
+            self.status_var.set("Environment Error - API keys missing")
+            self.log_output("⚠ Missing API keys. Please use 'Setup API Keys' to configure.\n")
     
     def validate_inputs(self, command):
         """Validate inputs before running command."""
@@ -332,45 +449,51 @@ class GitHubAuditGUI:
         
         return True
     
-    def build_command(self, action):
-        """Build the command line arguments."""
-        cmd = [sys.executable, 'github_audit_tool.py', action]
+    def collect_run_args(self):
+        """Read all form inputs once for the action about to run."""
+        return RunArgs(
+            repo=self.repository_var.get().strip(),
+            date=self.date_var.get().strip(),
+            author=self.author_var.get().strip(),
+            min_sha=self.min_commit_var.get().strip(),
+            max_sha=self.max_commit_var.get().strip(),
+            output=self.output_var.get().strip(),
+            voice=self.voice_var.get().strip(),
+            fmt=self.format_var.get(),
+            verbose=self.verbose_var.get(),
+            display_only=self.display_only_var.get(),
+            save=self.save_var.get()
+        )
+    
+    def build_command(self, action, args):
+        """Build the command line arguments (without the interpreter and script)."""
+        supported = ACTION_OPTIONS[action]
+        cmd = [action]
         
         # Add repository
         if action != 'setup':
-            cmd.append(self.repository_var.get().strip())
-        
-        # Add options
-        if self.date_var.get().strip():
-            cmd.extend(['--date', self.date_var.get().strip()])
-        
-        if self.author_var.get().strip():
-            cmd.extend(['--author', self.author_var.get().strip()])
-        
-        if self.min_commit_var.get().strip():
-            cmd.extend(['--min-commit', self.min_commit_var.get().strip()])
-        
-        if self.max_commit_var.get().strip():
-            cmd.extend(['--max-commit', self.max_commit_var.get().strip()])
-        
-        if self.output_var.get().strip() and not self.display_only_var.get():
-            cmd.extend(['--output', self.output_var.get().strip()])
-        
-        if self.voice_var.get().strip() and action in ['changelist', 'timeline']:
-            cmd.extend(['--voice', self.voice_var.get().strip()])
-        
-        # Format
-        cmd.extend(['--format', self.format_var.get()])
-        
-        # Boolean flags
-        if self.verbose_var.get() and action in ['changelist', 'timeline']:
-            cmd.append('--verbose')
-        
-        if self.display_only_var.get() and action in ['changelist', 'timeline']:
-            cmd.append('--display-only')
+            cmd.append(args.repo)
+        
+        # Options that take a value, then boolean flags; display-only wins over an output file
+        values = {
+            '--date': args.date,
+            '--author': args.author,
+            '--min-commit': args.min_sha,
+            '--max-commit': args.max_sha,
+            '--output': '' if args.display_only else args.output,
+            '--voice': args.voice,
+            '--format': args.fmt,
+        }
+        flags = {
+            '--verbose': args.verbose,
+            '--display-only': args.display_only,
+            '--save': args.save,
+        }
         
-        if self.save_var.get() and action in ['hours', 'rhythm', 'stats']:
-            cmd.append('--save')
+        for option, value in values.items():
+            if value and option in supported:
+                cmd.extend([option, value])
+        cmd.extend(flag for flag, enabled in flags.items() if enabled and flag in supported)
         
         return cmd
     
@@ -384,7 +507,7 @@ class GitHubAuditGUI:
             return
         
         # Build command
-        cmd = self.build_command(action)
+        cmd = self.build_command(action, self.collect_run_args())
         
         # Update UI
         self.is_running.set(True)
@@ -395,61 +518,187 @@ class GitHubAuditGUI:
         # Log command
         self.log_output(f"\n{'='*60}\n")
         self.log_output(f"Running: {action.upper()}\n")
-        self.log_output(f"Command: {' '.join(cmd)}\n")
+        self.log_output(f"Command: github_audit_tool.py {' '.join(cmd)}\n")
         self.log_output(f"{'='*60}\n")
         
+        # Setup is interactive, so it always gets its own subprocess. Verbose
+        # runs can dump very large diffs and stay out of the GUI process in the
+        # persistent worker; everything else runs in-process
+        if self.audit_tool is None or action == 'setup' or (self.legacy and '--verbose' in cmd):
+            target = self.execute_command
+        elif '--verbose' in cmd:
+            target = self.execute_in_worker
+        else:
+            target = self.execute_in_process
+        self.root.after(50, self.poll_output_queue)
+        
         # Run in thread
-        thread = threading.Thread(target=self.execute_command, args=(cmd, action), daemon=True)
+        thread = threading.Thread(target=target, args=(cmd, action), daemon=True)
         thread.start()
     
+    def execute_in_process(self, cmd, action):
+        """Execute the command in this process using the shared audit tool."""
+        writer = QueueWriter(self.output_queue)
+        exit_code = 0
+        
+        try:
+            with redirect_stdout(writer), redirect_stderr(writer):
+                try:
+                    self.tool_module().cli.main(args=cmd, prog_name='github_audit_tool.py',
+                             obj={'audit_tool': self.audit_tool}, standalone_mode=False)
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            
+            self.report_result(action, exit_code)
+        
+        except Exception as e:
+            self.report_error(action, e)
+        
+        finally:
+            # Reset UI
+            self.root.after(0, self.reset_ui)
+    
+    def poll_output_queue(self):
+        """Move queued action output into the text area."""
+        self.drain_output_queue()
+        if self.is_running.get():
+            self.root.after(50, self.poll_output_queue)
+    
+    def drain_output_queue(self):
+        """Log everything currently waiting in the output queue in one insert."""
+        chunks = []
+        while True:
+            try:
+                chunks.append(self.output_queue.get_nowait())
+            except queue.Empty:
+                break
+        if chunks:
+            self.log_output(''.join(chunks))
+    
     def execute_command(self, cmd, action):
-        """Execute the command and handle output."""
+        """Execute the command in a subprocess and handle output."""
+        import subprocess
+        
         try:
-            # Run the command
+            # Run the command, reading its combined output as raw bytes
             process = subprocess.Popen(
-                cmd,
+                [sys.executable, 'github_audit_tool.py'] + cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                universal_newlines=True,
-                bufsize=1
+                stderr=subprocess.STDOUT,
+                bufsize=0,
+                env={**os.environ, 'PYTHONIOENCODING': 'utf-8'}
             )
             
-            # Read output in real-time
-            while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    self.root.after(0, self.log_output, output)
+            # Read output in large chunks; the incremental decoder copes with
+            # multi-byte characters split across chunk boundaries
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            for chunk in iter(lambda: process.stdout.read(65536), b''):
+                text = decoder.decode(chunk)
+                if text:
+                    self.output_queue.put(text)
             
-            # Get any remaining output
-            stdout, stderr = process.communicate()
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                self.output_queue.put(tail)
             
-            # Log any remaining output
-            if stdout:
-                self.root.after(0, self.log_output, stdout)
-            if stderr:
-                self.root.after(0, self.log_output, f"Error: {stderr}")
+            process.wait()
             
-            # Check return code
-            if process.returncode == 0:
-                self.root.after(0, self.log_output, f"\n✓ {action} completed successfully!\n")
-                self.root.after(0, lambda: self.status_var.set(f"{action} completed successfully"))
-            else:
-                self.root.after(0, self.log_output, f"\n❌ {action} failed with exit code {process.returncode}\n")
-                self.root.after(0, lambda: self.status_var.set(f"{action} failed"))
+            self.report_result(action, process.returncode)
+            if process.returncode == 0 and action == 'setup':
+                # Pick up the freshly written .env for in-process and worker actions
+                self.root.after(0, self.reload_environment)
         
         except Exception as e:
-            self.root.after(0, self.log_output, f"\n❌ Error running {action}: {str(e)}\n")
-            self.root.after(0, lambda: self.status_var.set(f"Error: {str(e)}"))
+            self.report_error(action, e)
         
         finally:
             # Reset UI
             self.root.after(0, self.reset_ui)
     
+    def start_worker(self):
+        """Start the persistent worker process if it is not already running."""
+        import subprocess
+        
+        if self.worker is not None and self.worker.poll() is None:
+            return self.worker
+        
+        self.worker = subprocess.Popen(
+            [sys.executable, 'github_audit_tool.py', 'serve'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+            env={**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+        )
+        return self.worker
+    
+    def stop_worker(self):
+        """Shut down the persistent worker; it exits once its stdin is closed."""
+        worker, self.worker = self.worker, None
+        if worker is not None and worker.poll() is None:
+            worker.stdin.close()
+    
+    def execute_in_worker(self, cmd, action):
+        """Execute the command in the persistent worker process."""
+        import json
+        
+        try:
+            worker = self.start_worker()
+            worker.stdin.write(json.dumps({'args': cmd}) + "\n")
+            worker.stdin.flush()
+            
+            exit_code = None
+            for line in worker.stdout:
+                frame = json.loads(line)
+                if frame['type'] == 'output':
+                    self.output_queue.put(frame['text'])
+                elif frame['type'] == 'done':
+                    exit_code = frame['exit_code']
+                    break
+            
+            if exit_code is None:
+                # The worker died mid-command; the next action starts a fresh one
+                self.worker = None
+                raise RuntimeError("worker process exited unexpectedly")
+            
+            self.report_result(action, exit_code)
+        
+        except Exception as e:
+            self.report_error(action, e)
+        
+        finally:
+            # Reset UI
+            self.root.after(0, self.reset_ui)
+    
+    def report_result(self, action, exit_code):
+        """Log how an action finished and update the status bar."""
+        if exit_code == 0:
+            self.output_queue.put(f"\n✓ {action} completed successfully!\n")
+            self.root.after(0, lambda: self.status_var.set(f"{action} completed successfully"))
+        else:
+            self.output_queue.put(f"\n❌ {action} failed with exit code {exit_code}\n")
+            self.root.after(0, lambda: self.status_var.set(f"{action} failed"))
+    
+    def report_error(self, action, error):
+        """Log an error that prevented an action from running."""
+        self.output_queue.put(f"\n❌ Error running {action}: {str(error)}\n")
+        self.root.after(0, lambda: self.status_var.set(f"Error: {str(error)}"))
+    
+    def reload_environment(self):
+        """Reload .env after setup and recreate the shared audit tool."""
+        self.tool_module().reload_env()
+        self._env_ok = False
+        self.check_environment()
+        
+        # The worker loaded the old keys at startup, so replace it
+        if not self.legacy:
+            self.stop_worker()
+            self.start_worker()
+    
     def reset_ui(self):
         """Reset UI after command completion."""
+        self.drain_output_queue()
         self.is_running.set(False)
         self.set_buttons_state(True)
         self.progress_bar.stop()
@@ -461,20 +710,53 @@ class GitHubAuditGUI:
             button.configure(state=state)
     
     def log_output(self, text):
-        """Log output to the text area."""
-        self.output_text.insert(tk.END, text)
+        """Queue text for the output area; it is written on the next flush."""
+        self._log_queue.append(text)
+        if not self._log_pending:
+            self._log_pending = True
+            self.root.after(50, self._flush_log)
+    
+    def _flush_log(self):
+        """Write all queued text to the output area with a single insert."""
+        self._log_pending = False
+        if not self._log_queue:
+            return
+        
+        joined = ''.join(self._log_queue)
+        self._log_queue.clear()
+        
+        # Keep the widget bounded so huge outputs don't slow down every insert
+        line_count = int(self.output_text.index('end-1c').split('.')[0])
+        if line_count > MAX_OUTPUT_LINES:
+            self.output_text.delete('1.0', f'end-{MAX_OUTPUT_LINES}l')
+        
+        self.output_text.insert(tk.END, joined)
         self.output_text.see(tk.END)
-        self.root.update_idletasks()
+    
+    def clear_cache(self):
+        """Clear cached GitHub data so the next action refetches it."""
+        if self.audit_tool is None:
+            # The audit tool module may still be loading; importing it here would freeze the window
+            threading.Thread(target=lambda: self.tool_module().GitHubAuditTool.clear_caches(), daemon=True).start()
+        else:
+            self.tool_module().GitHubAuditTool.clear_caches()
+        
+        # The worker holds its own in-memory caches, so replace it with a fresh one
+        if not self.legacy:
+            self.stop_worker()
+            self.start_worker()
+        self.status_var.set("Cache cleared")
     
     def clear_output(self):
         """Clear the output text area."""
+        self._log_queue.clear()
         self.output_text.delete(1.0, tk.END)
         self.status_var.set("Output cleared")
 
 def main():
     """Main function to run the GUI."""
     root = tk.Tk()
-    app = GitHubAuditGUI(root)
+    app = GitHubAuditGUI(root, legacy='--legacy' in sys.argv[1:])
     
     # Center the window
     root.update_idletasks()
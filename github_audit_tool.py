@@ -5,70 +5,637 @@ A tool to generate changelists and calculate work hours from GitHub repositories
 """
 
 import os
+import io
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+import asyncio
+import fnmatch
+import functools
+import hashlib
+import heapq
+import itertools
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Dict, Optional, Tuple
+from dataclasses import dataclass
 import click
 from colorama import init, Fore, Style
 from github import Github, GithubException
-from openai import OpenAI
-from dotenv import load_dotenv
+from openai import OpenAI, AsyncOpenAI
+from dotenv import dotenv_values
 import json
+import operator
+import orjson
 from dateutil import parser
 import pytz
 import tiktoken
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import redirect_stdout, redirect_stderr
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Initialize colorama for cross-platform colored output
-init()
+# Initialize colorama for cross-platform colored output. Only a terminal needs
+# it: click.echo already strips ANSI codes when output is piped or redirected.
+if sys.stdout is not None and sys.stdout.isatty():
+    init()
 
-# Load environment variables
-load_dotenv()
+# Parse .env once; real environment variables take precedence over it
+_ENV = dotenv_values()
+
+def get_env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Return a setting from the environment, falling back to the .env file."""
+    return os.environ.get(key) or _ENV.get(key) or default
+
+def reload_env():
+    """Re-read the .env file, e.g. after setup has rewritten it."""
+    _ENV.clear()
+    _ENV.update(dotenv_values())
+
+# Upper bound on concurrent GitHub requests when fetching per-commit data
+MAX_FETCH_WORKERS = 16
+
+GITHUB_API_URL = 'https://api.github.com'
+GITHUB_GRAPHQL_URL = GITHUB_API_URL + '/graphql'
+
+# Lists a branch's commit history one page at a time, newest first
+COMMIT_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $since: GitTimestamp!, $until: GitTimestamp!, $author: CommitAuthor, $first: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: $first, since: $since, until: $until, author: $author, after: $cursor) {
+            pageInfo { hasNextPage endCursor }
+            nodes { oid message authoredDate changedFilesIfAvailable author { name } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Repositories whose first history page is requested in one aliased GraphQL query
+MAX_GRAPHQL_ALIASES = 50
+
+def _multi_repo_history_query(count: int) -> str:
+    """Build a query for the first history page of ``count`` repositories, aliased r0, r1, ..."""
+    params = ''.join(f', $owner{i}: String!, $name{i}: String!' for i in range(count))
+    fields = '\n'.join(f'  r{i}: repository(owner: $owner{i}, name: $name{i}) {{ ...firstHistoryPage }}' for i in range(count))
+    return f"""
+query($since: GitTimestamp!, $until: GitTimestamp!, $author: CommitAuthor{params}) {{
+{fields}
+}}
+
+fragment firstHistoryPage on Repository {{
+  defaultBranchRef {{
+    target {{
+      ... on Commit {{
+        history(first: 100, since: $since, until: $until, author: $author) {{
+          pageInfo {{ hasNextPage endCursor }}
+          nodes {{ oid message authoredDate changedFilesIfAvailable author {{ name }} }}
+        }}
+      }}
+    }}
+  }}
+}}
+"""
+
+# Upper bound on in-flight requests made by the async GitHub client
+MAX_ASYNC_REQUESTS = 10
+
+# Upper bound on concurrent OpenAI requests when generating several reports at once
+MAX_AI_REQUESTS = 10
+
+# Model used for all AI-generated reports
+OPENAI_MODEL = "gpt-4o"
+
+# SQLite file holding results that never change (diffs of a commit set, AI reports for a prompt)
+DISK_CACHE_PATH = '.audit_cache.sqlite3'
+
+# How long cached repository and commit-list lookups stay fresh (seconds)
+CACHE_TTL_SECONDS = 300
+
+# Patches longer than this are cut short before being sent to the AI
+MAX_PATCH_LINES = 80
+
+# Generated or vendored files whose patches are left out of the AI payload
+SKIPPED_PATCH_PATTERNS = ('package-lock.json', 'yarn.lock', '*.lock', '*.min.js', '*.min.css', '*.map', '*.svg')
+
+# Requests kept in reserve: below max(RATE_LIMIT_RESERVE, RATE_LIMIT_RESERVE_FRACTION * limit)
+# remaining calls, requests pause until the rate-limit window resets
+RATE_LIMIT_RESERVE = 10
+RATE_LIMIT_RESERVE_FRACTION = 0.02
+
+# Longest pause for a rate-limit reset before giving up with RateLimitError (seconds)
+MAX_RATE_LIMIT_WAIT = 900
+
+# Prompt skeletons for the AI reports, one per output format. They are
+# assembled once here and filled in with str.format_map for each request.
+_CHANGELIST_HEADER = """
+You are a professional software developer writing an end-of-day work report for a client.
+
+Based on the following {data_type} from {date_str}, please generate a clear, professional changelist that summarizes the work completed. 
+
+Format the response as a client-friendly report with:
+1. A brief summary of the work period
+2. Key features/changes implemented
+3. Bug fixes or improvements made
+4. Any technical details that might be relevant - but make sure not to be too technical. This is for a non-technical audience. Don't quote filenames or anything like that. Keep it digestible.
+
+Make it sound professional and client-appropriate, avoiding overly technical jargon where possible.
+"""
+
+_CHANGELIST_VOICE = """
+IMPORTANT: Please write this report with the following tone/voice: {voice}
+
+Make sure the entire report reflects this requested tone.
+"""
+
+_CHANGELIST_MARKDOWN = """
+Please format your response using Markdown syntax. You may use headers, bullet points, code blocks, emphasis, and other Markdown formatting to make the report well-structured and readable.
+"""
+
+_CHANGELIST_FOOTER = """
+Git commit data:
+{data}
+
+After the main report, provide a one paragraph summary of the work completed for the user's timesheet.
+
+Please provide a well-structured report:
+"""
+
+_TIMELINE_HEADER = """
+You are a technical project historian documenting the development timeline of a software project.
+
+Based on the following {data_type} from {date_str}, please generate a comprehensive development timeline that tells the story of how this project evolved chronologically.
+
+Create a historical narrative that includes:
+1. **Chronological Development Story** - Show the progression of work over time
+2. **Feature Evolution** - Highlight when major features and capabilities were introduced
+3. **Development Milestones** - Identify key moments and breakthroughs in the development process
+4. **Technical Progress** - Document how the codebase and architecture evolved
+5. **Work Patterns** - Note significant development phases or focus areas
+
+**IMPORTANT**: For each major development phase or feature mentioned, include the specific dates when that work occurred. This timeline should read like a project history that someone could use to understand how and when the project developed.
+
+Structure this as a narrative timeline that flows chronologically, making it clear what happened when. Focus on the evolution and progression of the project rather than just listing individual changes.
+"""
+
+_TIMELINE_VOICE = """
+IMPORTANT: Please write this timeline with the following tone/voice: {voice}
+
+Make sure the entire timeline reflects this requested tone while maintaining chronological accuracy.
+"""
+
+_TIMELINE_MARKDOWN = """
+Please format your response using Markdown syntax. Use headers for different time periods, bullet points for key developments, code blocks if needed, and other Markdown formatting to create a well-structured, readable timeline.
+"""
+
+_TIMELINE_FOOTER = """
+Git commit data (chronologically ordered):
+{data}
+
+Please provide a comprehensive development timeline:
+"""
+
+_PLAIN_TEXT_INSTRUCTION = """
+Please format your response as plain text only. Do NOT use any Markdown formatting, asterisks for emphasis, hash symbols for headers, or any other special formatting characters. Use only plain text with proper spacing and line breaks for structure.
+"""
+
+_CHANGELIST_PROMPTS = {
+    'markdown': _CHANGELIST_HEADER + "{voice_block}" + _CHANGELIST_MARKDOWN + _CHANGELIST_FOOTER,
+    'text': _CHANGELIST_HEADER + "{voice_block}" + _PLAIN_TEXT_INSTRUCTION + _CHANGELIST_FOOTER,
+}
+
+_TIMELINE_PROMPTS = {
+    'markdown': _TIMELINE_HEADER + "{voice_block}" + _TIMELINE_MARKDOWN + _TIMELINE_FOOTER,
+    'text': _TIMELINE_HEADER + "{voice_block}" + _PLAIN_TEXT_INSTRUCTION + _TIMELINE_FOOTER,
+}
+
+def _build_prompt(prompts: Dict[str, str], voice_template: str, data: str, date_range: Tuple[datetime, datetime],
+                  output_format: str, is_full_diff: bool, voice: Optional[str]) -> str:
+    """Fill in one of the prompt skeletons above for a report request."""
+    start_date, end_date = date_range
+    if start_date.date() == end_date.date():
+        date_str = start_date.strftime('%Y-%m-%d')
+    else:
+        date_str = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+    
+    template = prompts['markdown' if output_format.lower() == 'markdown' else 'text']
+    return template.format_map({
+        'data_type': "detailed Git commit data with diffs" if is_full_diff else "Git commit messages and metadata",
+        'date_str': date_str,
+        'voice_block': voice_template.format(voice=voice) if voice else "",
+        'data': data,
+    })
+
+class RateLimitError(Exception):
+    """Raised when the GitHub rate limit is nearly spent and resets too far in the future to wait for."""
+    
+    def __init__(self, reset_at: datetime):
+        self.reset_at = reset_at
+        super().__init__(f"GitHub API rate limit nearly exhausted; it resets at {reset_at.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+
+def _rate_limit_pause(remaining: int, limit: int, reset: float) -> float:
+    """Return how long to pause so the rate-limit reserve is left untouched (0 if there is quota to spare).
+    
+    Raises RateLimitError if the window resets later than MAX_RATE_LIMIT_WAIT from now.
+    """
+    if limit <= 0 or remaining >= max(RATE_LIMIT_RESERVE, RATE_LIMIT_RESERVE_FRACTION * limit):
+        return 0.0
+    
+    delay = max(0.0, reset - time.time()) + 1
+    if delay > MAX_RATE_LIMIT_WAIT:
+        raise RateLimitError(datetime.fromtimestamp(reset, timezone.utc))
+    return delay
+
+def _response_rate_limit_pause(headers) -> float:
+    """_rate_limit_pause for the X-RateLimit-* headers of a response (0 if they are missing)."""
+    try:
+        return _rate_limit_pause(int(headers['x-ratelimit-remaining']), int(headers['x-ratelimit-limit']),
+                                 float(headers['x-ratelimit-reset']))
+    except (KeyError, ValueError):
+        return 0.0
+
+def _rate_limit_delay(headers) -> Optional[float]:
+    """Return how long to wait before retrying a rate-limited response, or None if it wasn't rate limited."""
+    # Secondary rate limits tell us exactly how long to back off
+    retry_after = headers.get('retry-after')
+    if retry_after is not None:
+        return float(retry_after)
+    
+    # Primary rate limit exhausted - wait until the window resets
+    if headers.get('x-ratelimit-remaining') == '0':
+        reset = headers.get('x-ratelimit-reset')
+        if reset is not None:
+            return max(0.0, float(reset) - time.time()) + 1
+    
+    return None
+
+# Date keywords accepted by parse_date_range, mapped to the name used for them in report filenames
+_DATE_ALIASES = {
+    'today': 'today',
+    'yesterday': 'yesterday',
+    'week': 'thisweek',
+    'this-week': 'thisweek',
+    'last-week': 'lastweek',
+    'month': 'thismonth',
+    'this-month': 'thismonth',
+    'last-month': 'lastmonth',
+    'all': 'alltime',
+    'alltime': 'alltime',
+    'all-time': 'alltime',
+}
+
+# A gap of more than this many hours between commits starts a new work session
+WORK_BLOCK_GAP_HOURS = 2
+
+def _work_block_bounds(timestamps: List[int], max_gap_seconds: int) -> List[Tuple[int, int]]:
+    """Split sorted unix timestamps into work blocks.
+    
+    A gap longer than max_gap_seconds starts a new block. Returns the
+    (first, last) index of each block.
+    """
+    bounds = []
+    block_start = 0
+    previous = timestamps[0]
+    
+    for i in range(1, len(timestamps)):
+        current = timestamps[i]
+        if current - previous > max_gap_seconds:
+            bounds.append((block_start, i - 1))
+            block_start = i
+        previous = current
+    
+    bounds.append((block_start, len(timestamps) - 1))
+    return bounds
+
+def ttl_cache(maxsize: int = 128, ttl: Optional[float] = CACHE_TTL_SECONDS, key=None):
+    """LRU cache decorator whose entries expire after ``ttl`` seconds.
+    
+    ``key`` maps the call arguments to a cache key (defaults to all of them).
+    Use ``ttl=None`` for immutable data that never needs refetching. ``None``
+    results are not cached so failed lookups are retried. The wrapped function
+    gains a ``cache_clear()`` method.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            with lock:
+                entry = cache.get(cache_key)
+                if entry is not None and (ttl is None or time.monotonic() - entry[1] <= ttl):
+                    cache.move_to_end(cache_key)
+                    return entry[0]
+            
+            value = func(*args, **kwargs)
+            if value is not None:
+                with lock:
+                    cache[cache_key] = (value, time.monotonic())
+                    cache.move_to_end(cache_key)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return value
+        
+        def cache_clear():
+            with lock:
+                cache.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+class DiskCache:
+    """Persistent key/value store backed by SQLite.
+    
+    The database is opened on first use. Storage errors are treated as
+    cache misses, so a read-only or locked file never breaks a run.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+    
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+        return self._conn
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored value for key, or None."""
+        with self._lock:
+            try:
+                row = self._connection().execute('SELECT value FROM cache WHERE key = ?', (key,)).fetchone()
+            except sqlite3.Error:
+                return None
+        return row[0] if row else None
+    
+    def set(self, key: str, value: str) -> None:
+        """Store value under key, replacing any previous value."""
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute('INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)', (key, value))
+                conn.commit()
+            except sqlite3.Error:
+                pass
+    
+    def clear(self) -> None:
+        """Remove every stored value."""
+        if not os.path.exists(self.path):
+            return
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute('DELETE FROM cache')
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+def _digest(text: str) -> str:
+    """Short, stable hash used to build disk cache keys."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+def _compact_patch(filename: str, patch: Optional[str]) -> Optional[str]:
+    """Return the part of a file patch worth sending to the AI, or None to leave it out."""
+    if not patch:
+        return None
+    basename = os.path.basename(filename).lower()
+    if any(fnmatch.fnmatchcase(basename, pattern) for pattern in SKIPPED_PATCH_PATTERNS):
+        return None
+    
+    lines = patch.splitlines()
+    if len(lines) <= MAX_PATCH_LINES:
+        return patch
+    return '\n'.join(lines[:MAX_PATCH_LINES] + [f"... ({len(lines) - MAX_PATCH_LINES} more lines)"])
+
+# URL forms of a repository that are stripped down to owner/repo (lowercase, checked in order)
+_REPO_URL_PREFIXES = (
+    'https://github.com/',
+    'http://github.com/',
+    'git@github.com:',
+    'github.com/',
+    'www.github.com/'
+)
+
+@functools.lru_cache(maxsize=256)
+def _normalize_repo_name(repo_input: str) -> str:
+    """Normalize various repository input formats to owner/repo format."""
+    repo_name = repo_input.strip()
+    lowered = repo_name.lower()
+    
+    # Remove common URL prefixes
+    for prefix in _REPO_URL_PREFIXES:
+        if lowered.startswith(prefix):
+            repo_name = repo_name[len(prefix):]
+            lowered = lowered[len(prefix):]
+            break
+    
+    # Remove .git suffix if present
+    if lowered.endswith('.git'):
+        repo_name = repo_name[:-4]
+    
+    # Remove trailing slash if present
+    return repo_name.rstrip('/')
+
+def _decimal_hours_to_hhmm(decimal_hours: float) -> str:
+    """Convert decimal hours to HH:MM format."""
+    total_minutes = int(decimal_hours * 60)
+    hours = total_minutes // 60
+    minutes = total_minutes % 60
+    return f"{hours:02d}:{minutes:02d}"
+
+def _clock_time(moment: datetime) -> str:
+    """HH:MM of a datetime, without going through strftime's format parsing."""
+    return f"{moment.hour:02d}:{moment.minute:02d}"
+
+# Reports format the same few hour values over and over (zero, repeated day totals)
+@functools.lru_cache(maxsize=512)
+def _format_hours_display(decimal_hours: float) -> str:
+    """Format hours for display showing both decimal and HH:MM format."""
+    return f"{decimal_hours:.1f} hours ({_decimal_hours_to_hhmm(decimal_hours)})"
+
+# Day names in report order, Monday first
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_WORKDAYS = _WEEKDAYS[:5]
+_WEEKEND = _WEEKDAYS[5:]
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June',
+           'July', 'August', 'September', 'October', 'November', 'December')
+
+# Bar chart strings for the rhythm reports, indexed by length (charts are at most 20 wide)
+_BARS = tuple('█' * length for length in range(21))
+
+def _bar(count: int, max_count: int, width: int) -> str:
+    """Bar for count, scaled so max_count fills width characters."""
+    return _BARS[int((count / max_count) * width)]
+
+def _banner(title: str) -> str:
+    """Ruled green heading printed above a report on the console."""
+    return f"\n{Fore.GREEN}{'='*60}\n{title}\n{'='*60}{Style.RESET_ALL}\n"
+
+def _commit_diff_key(commit) -> str:
+    """Disk cache key for a commit's diff data; a SHA always names the same content."""
+    return 'diff:' + commit.sha
+
+def _github_timestamp(value: datetime) -> str:
+    """Format a datetime as a UTC ISO 8601 timestamp; naive values are taken to be UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def _parse_github_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp from the GitHub API into an aware UTC datetime."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).astimezone(timezone.utc)
+
+def _parse_date(value: str) -> datetime:
+    """Parse a user-supplied date, trying the fast ISO 8601 parser before dateutil's format guessing."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parser.parse(value)
+
+@dataclass
+class CommitRec:
+    """Flat record of the commit fields this tool reads, built once per listed commit.
+    
+    Reading these plain attributes avoids PyGithub's lazy property chains
+    (commit.commit.author.date) in the hot loops. ``files`` is not part of a
+    commit listing, so it is fetched from the REST API on first access:
+    through ``source`` when the commit came from PyGithub, otherwise with
+    ``repo.get_commit``. GraphQL listings also carry the number of changed
+    files, so ``files_changed`` needs no request for them.
+    """
+    # Declared by hand since dataclass(slots=True) needs Python 3.10; slots rule out field defaults
+    __slots__ = ('sha', 'url', 'message', 'author_name', 'date', 'timestamp', 'repo', 'source', '_files', 'changed_file_count')
+    
+    sha: str
+    url: str
+    message: str
+    author_name: Optional[str]
+    date: datetime
+    timestamp: int
+    repo: Any
+    source: Any
+    _files: Optional[List]
+    changed_file_count: Optional[int]
+    
+    @classmethod
+    def from_github(cls, commit, repo=None) -> 'CommitRec':
+        """Build a record from a PyGithub Commit.
+        
+        The fields are read from the commit's JSON as listed, skipping
+        PyGithub's attribute wrappers and its dateutil-based date parsing;
+        the regular properties are only used if that JSON is not available.
+        """
+        try:
+            raw = commit._rawData
+            author = raw['commit']['author']
+            date = _parse_github_timestamp(author['date'])
+            return cls(raw['sha'], raw['url'], raw['commit']['message'], author['name'], date,
+                       int(date.timestamp()), repo, commit, None, None)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            author = commit.commit.author
+            return cls(commit.sha, commit.url, commit.commit.message, author.name, author.date,
+                       int(author.date.timestamp()), repo, commit, None, None)
+    
+    @classmethod
+    def from_graphql(cls, repo, node: Dict) -> 'CommitRec':
+        """Build a record from a node of the GraphQL commit-history query."""
+        date = _parse_github_timestamp(node['authoredDate'])
+        # Repositories built with lazy=True only know their API path, not the full URL
+        repo_url = repo.url if repo.url.startswith('http') else GITHUB_API_URL + repo.url
+        return cls(node['oid'], f"{repo_url}/commits/{node['oid']}", node['message'],
+                   (node['author'] or {}).get('name'), date, int(date.timestamp()), repo, None, None,
+                   node.get('changedFilesIfAvailable'))
+    
+    @property
+    def files(self) -> List:
+        if self._files is None:
+            source = self.source if self.source is not None else self.repo.get_commit(self.sha)
+            self._files = source.files
+        return self._files
+    
+    @property
+    def files_changed(self) -> int:
+        """Number of files changed, fetching the file list only if the listing did not include it."""
+        if self.changed_file_count is not None:
+            return self.changed_file_count
+        return len(self.files)
+
+# Sort key for commit records: unix timestamps compare faster than datetimes
+_by_timestamp = operator.attrgetter('timestamp')
+
+# Key for (bucket, count) items when looking for the busiest bucket
+_by_count = operator.itemgetter(1)
 
 class GitHubAuditTool:
+    # Shared by all instances so clear_caches() can reach it
+    disk_cache = DiskCache(DISK_CACHE_PATH)
+    
     def __init__(self, github_token: str, openai_api_key: str):
         """Initialize the GitHub audit tool with API keys."""
         try:
-            self.github = Github(github_token)
+            # Size the connection pool for concurrent per-commit fetches, and
+            # request the REST maximum of 100 items per page when paginating
+            self.github = Github(github_token, per_page=100, pool_size=MAX_FETCH_WORKERS)
             self.user = self.github.get_user()
         except Exception as e:
             raise Exception(f"Failed to initialize GitHub client: {e}")
         
         try:
-            # Simple OpenAI client initialization - automatically uses OPENAI_API_KEY from environment
-            self.openai_client = OpenAI()
+            # The key may only live in .env, which is not loaded into os.environ
+            self.openai_client = OpenAI(api_key=openai_api_key)
+            self.async_openai_client = AsyncOpenAI(api_key=openai_api_key)
             # Initialize token encoder for token counting
-            self.token_encoder = tiktoken.encoding_for_model("gpt-4o")
+            self.token_encoder = tiktoken.encoding_for_model(OPENAI_MODEL)
         except Exception as e:
             raise Exception(f"Failed to initialize OpenAI client: {e}")
         
+        # Token for direct REST calls, and the lazily started event loop that runs them
+        self._github_token = github_token
+        # Keep-alive session for GraphQL queries, retrying transient server errors
+        self._http = requests.Session()
+        self._http.headers['Authorization'] = f'bearer {github_token}'
+        self._http.mount('https://', HTTPAdapter(
+            pool_maxsize=MAX_FETCH_WORKERS,
+            max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=(502, 503, 504), allowed_methods=None)
+        ))
+        self._http.hooks['response'].append(self._pause_for_rate_limit)
+        # Time (time.time()) before which async REST requests hold off to spare the rate limit
+        self._rate_limited_until = 0.0
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        
     def _normalize_repo_name(self, repo_input: str) -> str:
         """Normalize various repository input formats to owner/repo format."""
-        repo_name = repo_input.strip()
-        
-        # Remove common URL prefixes
-        prefixes_to_remove = [
-            'https://github.com/',
-            'http://github.com/',
-            'git@github.com:',
-            'github.com/',
-            'www.github.com/'
-        ]
-        
-        for prefix in prefixes_to_remove:
-            if repo_name.lower().startswith(prefix.lower()):
-                repo_name = repo_name[len(prefix):]
-                break
-        
-        # Remove .git suffix if present
-        if repo_name.lower().endswith('.git'):
-            repo_name = repo_name[:-4]
-        
-        # Remove trailing slash if present
-        repo_name = repo_name.rstrip('/')
-        
-        return repo_name
+        return _normalize_repo_name(repo_input)
+    
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Drop all cached repositories, commit lists, diffs, and AI reports."""
+        cls.get_repository.cache_clear()
+        cls._list_commits.cache_clear()
+        cls.get_commit_diff.cache_clear()
+        cls._fragment_tokens.cache_clear()
+        cls._graphql_author_filter.cache_clear()
+        cls.disk_cache.clear()
     
+    @functools.cached_property
+    def login(self) -> str:
+        """Login of the authenticated user, fetched once per tool instance."""
+        return self.user.login
+    
+    @ttl_cache()
     def get_repository(self, repo_name: str):
         """Get a GitHub repository object."""
         # Normalize the repository name to handle various URL formats
@@ -79,14 +646,13 @@ class GitHubAuditTool:
             click.echo(f"{Fore.CYAN}Normalized repository name: {normalized_name}{Style.RESET_ALL}")
         
         try:
-            # Try user's repository first
-            return self.user.get_repo(normalized_name)
-        except GithubException:
-            # Try organization repository
-            try:
+            if '/' in normalized_name:
+                # owner/repo - the user's own, an organization's or anyone else's
                 return self.github.get_repo(normalized_name)
-            except GithubException as e:
-                raise Exception(f"Repository '{normalized_name}' not found: {e}")
+            # A bare name refers to one of the user's own repositories
+            return self.user.get_repo(normalized_name)
+        except GithubException as e:
+            raise Exception(f"Repository '{normalized_name}' not found: {e}")
     
     def parse_date_range(self, date_input: str) -> Tuple[datetime, datetime]:
         """Parse date input which can be a single date or date range."""
@@ -99,50 +665,52 @@ class GitHubAuditTool:
         if '..' in date_input or ':' in date_input:
             separator = '..' if '..' in date_input else ':'
             start_str, end_str = date_input.split(separator, 1)
-            start_date = parser.parse(start_str.strip())
-            end_date = parser.parse(end_str.strip())
+            start_date = _parse_date(start_str.strip())
+            end_date = _parse_date(end_str.strip())
         else:
             # Single date - check for special keywords
             date_input = date_input.lower().strip()
             today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
             
-            if date_input in ['today']:
+            date_alias = _DATE_ALIASES.get(date_input)
+            
+            if date_alias == 'today':
                 start_date = today
                 end_date = today
-            elif date_input in ['yesterday']:
+            elif date_alias == 'yesterday':
                 start_date = today - timedelta(days=1)
                 end_date = start_date
-            elif date_input in ['week', 'this-week']:
+            elif date_alias == 'thisweek':
                 # Current week (Monday to Sunday)
                 days_since_monday = today.weekday()
                 start_date = today - timedelta(days=days_since_monday)
                 end_date = start_date + timedelta(days=6)
-            elif date_input in ['last-week']:
+            elif date_alias == 'lastweek':
                 days_since_monday = today.weekday()
                 this_monday = today - timedelta(days=days_since_monday)
                 start_date = this_monday - timedelta(days=7)
                 end_date = start_date + timedelta(days=6)
-            elif date_input in ['month', 'this-month']:
+            elif date_alias == 'thismonth':
                 start_date = today.replace(day=1)
                 if today.month == 12:
                     end_date = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
                 else:
                     end_date = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
-            elif date_input in ['last-month']:
+            elif date_alias == 'lastmonth':
                 if today.month == 1:
                     start_date = today.replace(year=today.year - 1, month=12, day=1)
                     end_date = today.replace(day=1) - timedelta(days=1)
                 else:
                     start_date = today.replace(month=today.month - 1, day=1)
                     end_date = today.replace(day=1) - timedelta(days=1)
-            elif date_input in ['all', 'alltime', 'all-time']:
+            elif date_alias == 'alltime':
                 # Entire repository history - use a very wide date range
                 # Start from early Git era and go to future to capture everything
                 start_date = datetime(2005, 1, 1)  # Git was created in 2005
                 end_date = today + timedelta(days=1)  # Through today
             else:
                 # Regular date parsing
-                start_date = parser.parse(date_input)
+                start_date = _parse_date(date_input)
                 end_date = start_date
         
         # Ensure timezone awareness
@@ -157,50 +725,177 @@ class GitHubAuditTool:
         
         return start_date, end_date
     
-    def get_commits_for_date_range(self, repo, start_date: datetime, end_date: datetime, author: Optional[str] = None, min_commit_sha: Optional[str] = None, max_commit_sha: Optional[str] = None) -> List:
-        """Get all commits for a date range, optionally limited to a range between min_commit_sha and max_commit_sha."""
-        commits = []
+    def get_commits_for_date_range(self, repo, start_date: datetime, end_date: datetime, author: Optional[str] = None, min_commit_sha: Optional[str] = None, max_commit_sha: Optional[str] = None, max_commits: Optional[int] = None) -> List:
+        """Get all commits for a date range, optionally limited to a range between min_commit_sha and max_commit_sha.
         
+        If max_commits is given, only the newest max_commits commits in the
+        range are fetched, and pagination stops as soon as they are in;
+        None or 0 means no limit. GitHub errors are reported as a warning
+        and give an empty list.
+        """
+        # Both listing paths then agree that 0 is no limit (islice would return nothing)
+        max_commits = max_commits or None
+        try:
+            return self._list_commits(repo, start_date, end_date, author, min_commit_sha, max_commit_sha, max_commits)
+        except GithubException as e:
+            click.echo(f"{Fore.YELLOW}Warning: {e}{Style.RESET_ALL}")
+            return []
+    
+    @ttl_cache()
+    def _list_commits(self, repo, start_date: datetime, end_date: datetime, author: Optional[str], min_commit_sha: Optional[str], max_commit_sha: Optional[str], max_commits: Optional[int]) -> List:
+        """Listing behind get_commits_for_date_range; errors propagate, so only real listings are cached."""
+        # List the whole range with a few GraphQL queries (100 commits each),
+        # falling back to the paginated REST listing if GraphQL fails
         try:
-            # Get commits for the date range
+            commits = self._graphql_commits_for_date_range(repo, start_date, end_date, author or self.login, max_commits)
+        except (requests.RequestException, GithubException, KeyError, TypeError, ValueError):
             repo_commits = repo.get_commits(
                 since=start_date,
                 until=end_date,
-                author=author or self.user.login
+                author=author or self.login
             )
-            
-            # Collect all commits first
-            for commit in repo_commits:
-                commits.append(commit)
-            
-            # Sort commits chronologically (oldest first)
-            commits = sorted(commits, key=lambda c: c.commit.author.date)
-            
-            # Find the range if min_commit_sha or max_commit_sha is specified
-            start_index = 0
-            end_index = len(commits)
-            
-            if min_commit_sha:
-                for i, commit in enumerate(commits):
-                    if commit.sha.startswith(min_commit_sha):
-                        start_index = i
-                        break
-            
-            if max_commit_sha:
-                for i, commit in enumerate(commits):
-                    if commit.sha.startswith(max_commit_sha):
-                        end_index = i + 1  # Include the max commit
-                        break
-            
-            # Return the specified range
+            # PaginatedList fetches pages lazily, so islice stops paging early
+            commits = [CommitRec.from_github(commit, repo) for commit in itertools.islice(repo_commits, max_commits)]
+        
+        # Sort commits chronologically (oldest first)
+        commits = sorted(commits, key=_by_timestamp)
+        
+        # Limit to the range if min_commit_sha or max_commit_sha is specified
+        if min_commit_sha or max_commit_sha:
+            start_index = self._find_commit_index(commits, min_commit_sha, 0)
+            end_index = self._find_commit_index(commits, max_commit_sha, len(commits) - 1) + 1  # Include the max commit
             commits = commits[start_index:end_index]
-                        
-        except GithubException as e:
-            click.echo(f"{Fore.YELLOW}Warning: {e}{Style.RESET_ALL}")
         
         return commits
     
-    def get_commits_for_date(self, repo, target_date: datetime, author: Optional[str] = None, min_commit_sha: Optional[str] = None, max_commit_sha: Optional[str] = None) -> List:
+    @staticmethod
+    def _find_commit_index(commits: List, sha_prefix: Optional[str], default: int) -> int:
+        """Index of the earliest commit whose SHA starts with sha_prefix, or default if there is none."""
+        if not sha_prefix:
+            return default
+        return next((i for i, commit in enumerate(commits) if commit.sha.startswith(sha_prefix)), default)
+    
+    def _pause_for_rate_limit(self, response, *args, **kwargs):
+        """requests response hook: sleep until the rate limit resets once the reserve is reached."""
+        pause = _response_rate_limit_pause(response.headers)
+        if pause:
+            click.echo(f"{Fore.YELLOW}GitHub rate limit nearly spent, waiting {pause:.0f}s for it to reset...{Style.RESET_ALL}")
+            time.sleep(pause)
+    
+    def _graphql(self, query: str, variables: Dict, partial: bool = False) -> Dict:
+        """Run a GitHub GraphQL query and return its data.
+        
+        With partial=True, errors are tolerated as long as some data came
+        back (e.g. one aliased repository not being found).
+        """
+        response = self._http.post(
+            GITHUB_GRAPHQL_URL,
+            json={'query': query, 'variables': variables},
+            timeout=30
+        )
+        response.raise_for_status()
+        
+        payload = response.json()
+        if payload.get('errors') and not (partial and payload.get('data')):
+            raise GithubException(response.status_code, payload, None)
+        return payload['data']
+    
+    @ttl_cache()
+    def _graphql_author_filter(self, author: str) -> Dict:
+        """Translate a login or email address into a GraphQL CommitAuthor filter."""
+        if '@' in author:
+            return {'emails': [author]}
+        
+        data = self._graphql('query($login: String!) { user(login: $login) { id } }', {'login': author})
+        return {'id': data['user']['id']}
+    
+    def _graphql_commits_for_date_range(self, repo, start_date: datetime, end_date: datetime, author: str, max_commits: Optional[int] = None) -> List[CommitRec]:
+        """List an author's commits on the default branch using the GraphQL API (newest first)."""
+        owner, name = repo.full_name.split('/', 1)
+        variables = {
+            'owner': owner,
+            'name': name,
+            'since': _github_timestamp(start_date),
+            'until': _github_timestamp(end_date),
+            'author': self._graphql_author_filter(author),
+            'first': min(100, max_commits) if max_commits else 100,
+            'cursor': None
+        }
+        return self._graphql_history(repo, variables, max_commits)
+    
+    def _graphql_history(self, repo, variables: Dict, max_commits: Optional[int] = None, commits: Optional[List[CommitRec]] = None) -> List[CommitRec]:
+        """Page through COMMIT_HISTORY_QUERY starting at variables['cursor'], appending to commits."""
+        commits = [] if commits is None else commits
+        while True:
+            data = self._graphql(COMMIT_HISTORY_QUERY, variables)
+            history = data['repository']['defaultBranchRef']['target']['history']
+            commits.extend(CommitRec.from_graphql(repo, node) for node in history['nodes'])
+            
+            if max_commits and len(commits) >= max_commits:
+                return commits[:max_commits]
+            if not history['pageInfo']['hasNextPage']:
+                return commits
+            variables['cursor'] = history['pageInfo']['endCursor']
+    
+    def get_commits_for_repositories(self, repo_names: List[str], start_date: datetime, end_date: datetime, author: Optional[str] = None) -> Dict[str, List[CommitRec]]:
+        """Get an author's commits in a date range for several repositories at once.
+        
+        The first page of every repository's history is listed by a single
+        aliased GraphQL query (MAX_GRAPHQL_ALIASES repositories per request);
+        only repositories with more than 100 matching commits need follow-up
+        pages. Returns commits sorted oldest first, keyed by owner/repo name;
+        repositories that could not be found are left out with a warning.
+        """
+        names = list(dict.fromkeys(self._normalize_repo_name(name) for name in repo_names))
+        author = author or self.login
+        shared = {
+            'since': _github_timestamp(start_date),
+            'until': _github_timestamp(end_date),
+            'author': self._graphql_author_filter(author)
+        }
+        
+        results = {}
+        for offset in range(0, len(names), MAX_GRAPHQL_ALIASES):
+            batch = names[offset:offset + MAX_GRAPHQL_ALIASES]
+            variables = dict(shared)
+            for i, full_name in enumerate(batch):
+                variables[f'owner{i}'], variables[f'name{i}'] = full_name.split('/', 1)
+            
+            try:
+                data = self._graphql(_multi_repo_history_query(len(batch)), variables, partial=True)
+            except (requests.RequestException, GithubException, KeyError, TypeError, ValueError):
+                # Fall back to listing each repository on its own
+                for full_name in batch:
+                    try:
+                        repo = self.get_repository(full_name)
+                    except Exception as e:
+                        click.echo(f"{Fore.YELLOW}Warning: {e}{Style.RESET_ALL}")
+                        continue
+                    results[full_name] = self.get_commits_for_date_range(repo, start_date, end_date, author)
+                continue
+            
+            for i, full_name in enumerate(batch):
+                repository = data.get(f'r{i}')
+                if repository is None:
+                    click.echo(f"{Fore.YELLOW}Warning: Repository {full_name} not found or not accessible{Style.RESET_ALL}")
+                    continue
+                
+                # Built lazily, so no request is made for it; file lookups go through it on demand
+                repo = self.github.get_repo(full_name, lazy=True)
+                branch = repository['defaultBranchRef']
+                history = branch['target']['history'] if branch else {'nodes': [], 'pageInfo': {'hasNextPage': False}}
+                commits = [CommitRec.from_graphql(repo, node) for node in history['nodes']]
+                
+                if history['pageInfo']['hasNextPage']:
+                    owner, name = full_name.split('/', 1)
+                    self._graphql_history(repo, {**shared, 'owner': owner, 'name': name, 'first': 100,
+                                                 'cursor': history['pageInfo']['endCursor']}, commits=commits)
+                
+                results[full_name] = sorted(commits, key=_by_timestamp)
+        
+        return results
+    
+    def get_commits_for_date(self, repo, target_date: datetime, author: Optional[str] = None, min_commit_sha: Optional[str] = None, max_commit_sha: Optional[str] = None, max_commits: Optional[int] = None) -> List:
         """Get all commits for a specific date (legacy method for backwards compatibility)."""
         # Set timezone to UTC if not specified
         if target_date.tzinfo is None:
@@ -210,7 +905,32 @@ class GitHubAuditTool:
         start_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_date = start_date + timedelta(days=1)
         
-        return self.get_commits_for_date_range(repo, start_date, end_date, author, min_commit_sha, max_commit_sha)
+        return self.get_commits_for_date_range(repo, start_date, end_date, author, min_commit_sha, max_commit_sha, max_commits)
+    
+    def _iter_days(self, commits: List):
+        """Yield (date, commits, hours) for each UTC day with commits, oldest first.
+        
+        One chronological sweep: after a single sort each day is a run of
+        consecutive commits, split into the same work blocks as
+        calculate_work_hours uses.
+        """
+        for _, day_run in itertools.groupby(sorted(commits, key=_by_timestamp), key=lambda c: c.timestamp // 86400):
+            day_commits = list(day_run)
+            timestamps = [c.timestamp for c in day_commits]
+            day_hours = sum(
+                self._calculate_block_hours(day_commits[first].date, day_commits[last].date, last - first + 1)
+                for first, last in _work_block_bounds(timestamps, WORK_BLOCK_GAP_HOURS * 3600)
+            )
+            yield day_commits[0].date.date(), day_commits, day_hours
+    
+    def calculate_work_hours_by_day(self, commits: List) -> Dict:
+        """Calculate work hours for each day with commits in one pass.
+        
+        Returns a dict keyed by date, in chronological order, of
+        (hours, commit count) tuples; each day's hours match
+        calculate_work_hours for that day's commits.
+        """
+        return {date: (day_hours, len(day_commits)) for date, day_commits, day_hours in self._iter_days(commits)}
     
     def analyze_coding_rhythm(self, commits: List) -> Dict:
         """Analyze coding patterns throughout the day and week."""
@@ -223,26 +943,19 @@ class GitHubAuditTool:
         hourly_hours = defaultdict(float)
         daily_hours = defaultdict(float)
         
-        # Group commits by date for daily analysis
-        commits_by_date = defaultdict(list)
-        for commit in commits:
-            commit_date = commit.commit.author.date.date()
-            commits_by_date[commit_date].append(commit)
-        
-        # Analyze each day
-        for date, day_commits in commits_by_date.items():
-            # Calculate hours for this day
-            day_hours, _, _, _ = self.calculate_work_hours(day_commits)
-            day_name = date.strftime('%A')
+        commits_by_date = {}
+        for date, day_commits, day_hours in self._iter_days(commits):
+            commits_by_date[date] = day_commits
+            day_name = _WEEKDAYS[date.weekday()]
             daily_commits[day_name] += len(day_commits)
             daily_hours[day_name] += day_hours
             
-            # Analyze hourly patterns
+            # Analyze hourly patterns, distributing daily hours proportionally across commit hours
+            share = day_hours / len(day_commits)
             for commit in day_commits:
-                hour = commit.commit.author.date.hour
+                hour = commit.timestamp // 3600 % 24
                 hourly_commits[hour] += 1
-                # Distribute daily hours proportionally across commit hours
-                hourly_hours[hour] += day_hours / len(day_commits)
+                hourly_hours[hour] += share
         
         # Calculate productivity metrics
         total_commits = len(commits)
@@ -250,8 +963,8 @@ class GitHubAuditTool:
         avg_commits_per_day = total_commits / total_days if total_days > 0 else 0
         
         # Find peak hours and days
-        peak_hour = max(hourly_commits.items(), key=lambda x: x[1]) if hourly_commits else (0, 0)
-        peak_day = max(daily_commits.items(), key=lambda x: x[1]) if daily_commits else ("Unknown", 0)
+        peak_hour = max(hourly_commits.items(), key=_by_count) if hourly_commits else (0, 0)
+        peak_day = max(daily_commits.items(), key=_by_count) if daily_commits else ("Unknown", 0)
         
         # Calculate work span (earliest to latest commit hour)
         if hourly_commits:
@@ -283,65 +996,33 @@ class GitHubAuditTool:
         if not commits:
             return 0.0, None, None, []
         
-        # Sort commits by date
-        sorted_commits = sorted(commits, key=lambda c: c.commit.author.date)
+        # Sort once; the block detection only needs the integer timestamps
+        sorted_commits = sorted(commits, key=_by_timestamp)
+        commit_times = [c.date for c in sorted_commits]
         
-        if len(sorted_commits) == 1:
+        if len(commit_times) == 1:
             # Single commit: assume 30 min prep work + 10 min for the commit (40 min total)
-            commit_time = sorted_commits[0].commit.author.date
+            commit_time = commit_times[0]
             return 0.67, commit_time, commit_time, [{'start': commit_time, 'end': commit_time, 'hours': 0.67, 'commits': 1}]
         
-        # Group commits into work blocks
+        timestamps = [c.timestamp for c in sorted_commits]
         work_blocks = []
-        current_block_start = sorted_commits[0].commit.author.date
-        current_block_commits = [sorted_commits[0]]
-        
-        # Consider a gap of more than 2 hours as a break between work sessions
-        MAX_GAP_HOURS = 2
-        
-        for i in range(1, len(sorted_commits)):
-            current_commit = sorted_commits[i]
-            previous_commit = sorted_commits[i-1]
-            
-            time_gap = current_commit.commit.author.date - previous_commit.commit.author.date
-            gap_hours = time_gap.total_seconds() / 3600
-            
-            if gap_hours > MAX_GAP_HOURS:
-                # End current block and start a new one
-                block_end = previous_commit.commit.author.date
-                block_hours = self._calculate_block_hours(current_block_start, block_end, len(current_block_commits))
-                
-                work_blocks.append({
-                    'start': current_block_start,
-                    'end': block_end, 
-                    'hours': block_hours,
-                    'commits': len(current_block_commits)
-                })
-                
-                # Start new block
-                current_block_start = current_commit.commit.author.date
-                current_block_commits = [current_commit]
-            else:
-                # Continue current block
-                current_block_commits.append(current_commit)
-        
-        # Add the final block
-        block_end = sorted_commits[-1].commit.author.date
-        block_hours = self._calculate_block_hours(current_block_start, block_end, len(current_block_commits))
-        
-        work_blocks.append({
-            'start': current_block_start,
-            'end': block_end,
-            'hours': block_hours, 
-            'commits': len(current_block_commits)
-        })
+        for first, last in _work_block_bounds(timestamps, WORK_BLOCK_GAP_HOURS * 3600):
+            block_start = commit_times[first]
+            block_end = commit_times[last]
+            commit_count = last - first + 1
+            
+            work_blocks.append({
+                'start': block_start,
+                'end': block_end,
+                'hours': self._calculate_block_hours(block_start, block_end, commit_count),
+                'commits': commit_count
+            })
         
         # Calculate total hours
         total_hours = sum(block['hours'] for block in work_blocks)
-        first_commit_time = sorted_commits[0].commit.author.date
-        last_commit_time = sorted_commits[-1].commit.author.date
         
-        return total_hours, first_commit_time, last_commit_time, work_blocks
+        return total_hours, commit_times[0], commit_times[-1], work_blocks
     
     def _calculate_block_hours(self, start_time: datetime, end_time: datetime, commit_count: int) -> float:
         """Calculate hours for a single work block.
@@ -369,18 +1050,20 @@ class GitHubAuditTool:
     
     def _decimal_hours_to_hhmm(self, decimal_hours: float) -> str:
         """Convert decimal hours to HH:MM format."""
-        total_minutes = int(decimal_hours * 60)
-        hours = total_minutes // 60
-        minutes = total_minutes % 60
-        return f"{hours:02d}:{minutes:02d}"
+        return _decimal_hours_to_hhmm(decimal_hours)
     
     def _format_hours_display(self, decimal_hours: float) -> str:
         """Format hours for display showing both decimal and HH:MM format."""
-        hhmm = self._decimal_hours_to_hhmm(decimal_hours)
-        return f"{decimal_hours:.1f} hours ({hhmm})"
+        return _format_hours_display(decimal_hours)
     
-    def count_tokens(self, text: str) -> int:
-        """Count tokens in text using the OpenAI tokenizer."""
+    def count_tokens(self, text: str, limit: Optional[int] = None) -> int:
+        """Count tokens in text using the OpenAI tokenizer.
+        
+        With a limit, text long enough to be far over it (more than 16 characters
+        per allowed token) is estimated instead of tokenized, since it is rejected either way.
+        """
+        if limit is not None and len(text) > limit * 16:
+            return len(text) // 4
         try:
             return len(self.token_encoder.encode(text))
         except Exception:
@@ -391,191 +1074,437 @@ class GitHubAuditTool:
         """Get commit messages only (lightweight version)."""
         commit_data = []
         
+        # GraphQL listings carry the counts; anything else needs its file list
+        self._prefetch_files([commit for commit in commits if getattr(commit, 'changed_file_count', 0) is None])
+        
         for commit in commits:
             commit_info = {
                 'sha': commit.sha[:8],
-                'message': commit.commit.message,
-                'timestamp': commit.commit.author.date.isoformat(),
-                'files_changed': len(commit.files) if hasattr(commit, 'files') else 0
+                'message': commit.message,
+                'timestamp': commit.date,
+                'files_changed': commit.files_changed
             }
             commit_data.append(commit_info)
         
-        return json.dumps(commit_data, indent=2)
+        return orjson.dumps(commit_data, option=orjson.OPT_INDENT_2).decode()
 
-    def get_commit_diffs(self, commits: List, max_tokens: int = 100000) -> Tuple[str, bool]:
-        """Get diffs for all commits, with token limit checking."""
-        all_diffs = []
+    # Commits are immutable, so diffs are cached by SHA without expiry
+    @ttl_cache(maxsize=1024, ttl=None, key=lambda self, commit: commit.sha)
+    def get_commit_diff(self, commit) -> Optional[Dict]:
+        """Get the diff data for a single commit, or None if it could not be fetched."""
+        cached = self.disk_cache.get(_commit_diff_key(commit))
+        if cached is not None:
+            return orjson.loads(cached)
+        
+        # Listing the files costs a REST request; hold off while the rate limit is nearly spent
+        remaining, limit = self.github.rate_limiting
+        pause = _rate_limit_pause(remaining, limit, self.github.rate_limiting_resettime)
+        if pause:
+            time.sleep(pause)
         
-        for commit in commits:
-            try:
-                # Get the commit details with diff
-                commit_data = {
-                    'sha': commit.sha[:8],
-                    'message': commit.commit.message,
-                    'timestamp': commit.commit.author.date.isoformat(),
-                    'files_changed': []
+        try:
+            # Get the commit details with diff
+            commit_data = {
+                'sha': commit.sha[:8],
+                'message': commit.message,
+                'timestamp': commit.date.isoformat(),
+                'files_changed': []
+            }
+            
+            # Get files changed in this commit
+            for file in commit.files:
+                file_data = {
+                    'filename': file.filename,
+                    'status': file.status,
+                    'additions': file.additions,
+                    'deletions': file.deletions,
+                    'patch': file.patch if hasattr(file, 'patch') and file.patch else None
                 }
-                
-                # Get files changed in this commit
-                for file in commit.files:
-                    file_data = {
-                        'filename': file.filename,
-                        'status': file.status,
-                        'additions': file.additions,
-                        'deletions': file.deletions,
-                        'patch': file.patch if hasattr(file, 'patch') and file.patch else None
-                    }
-                    commit_data['files_changed'].append(file_data)
-                
-                all_diffs.append(commit_data)
-                
-            except Exception as e:
-                click.echo(f"{Fore.YELLOW}Warning: Could not get diff for commit {commit.sha[:8]}: {e}{Style.RESET_ALL}")
+                commit_data['files_changed'].append(file_data)
+            
+            self.disk_cache.set(_commit_diff_key(commit), orjson.dumps(commit_data).decode())
+            return commit_data
+            
+        except Exception as e:
+            click.echo(f"{Fore.YELLOW}Warning: Could not get diff for commit {commit.sha[:8]}: {e}{Style.RESET_ALL}")
+            return None
+
+    def get_commit_diffs(self, commits: List, max_tokens: int = 100000, executor: Optional[Executor] = None) -> Tuple[str, bool]:
+        """Get diffs for all commits, with token limit checking.
         
-        diff_json = json.dumps(all_diffs, indent=2)
-        token_count = self.count_tokens(diff_json)
+        The per-commit fetches run concurrently, on ``executor`` if one is
+        given or on a pool of up to MAX_FETCH_WORKERS threads otherwise
+        (results keep the order of ``commits``). Commits whose diff was
+        fetched before are read from the disk cache instead.
+        """
+        if executor is not None:
+            results = list(executor.map(self.get_commit_diff, commits))
+        elif commits:
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(commits))) as pool:
+                results = list(pool.map(self.get_commit_diff, commits))
+        else:
+            results = []
         
-        # Return the data and whether it exceeds token limit
-        return diff_json, token_count <= max_tokens
+        all_diffs = [commit_data for commit_data in results if commit_data is not None]
+        return self._fit_diffs(all_diffs, max_tokens)
+    
+    @ttl_cache(maxsize=4096, ttl=None, key=lambda self, fragment: _digest(fragment))
+    def _fragment_tokens(self, fragment: str) -> int:
+        """Token count of one commit's JSON fragment, memoized since the same commits recur across reports."""
+        return self.count_tokens(fragment)
     
-    def generate_changelist_with_ai(self, data: str, date_range: Tuple[datetime, datetime], output_format: str = 'text', is_full_diff: bool = True, voice: Optional[str] = None) -> str:
-        """Generate a professional changelist using OpenAI."""
+    def _fit_diffs(self, all_diffs: List[Dict], max_tokens: int) -> Tuple[str, bool]:
+        """Build the compact diff JSON sent to the AI and fit it into max_tokens.
         
-        start_date, end_date = date_range
-        if start_date.date() == end_date.date():
-            date_str = start_date.strftime('%Y-%m-%d')
+        Patches are cut to MAX_PATCH_LINES and left out for generated files.
+        If that is still too large, patches are dropped from the oldest commits
+        first (file names and line counts are kept), using the fewest drops
+        that fit. Returns the payload and whether it fits.
+        
+        The size is the sum of each commit's (memoized) token count, so only
+        commits not seen before are tokenized; this can differ from tokenizing
+        the joined payload by a token or so per commit.
+        """
+        compacted = [
+            {**commit_data, 'files_changed': [
+                {**file_data, 'patch': _compact_patch(file_data['filename'], file_data['patch'])}
+                for file_data in commit_data['files_changed']
+            ]}
+            for commit_data in all_diffs
+        ]
+        fragments = [orjson.dumps(commit_data).decode() for commit_data in compacted]
+        
+        def stripped(i: int) -> str:
+            commit_data = compacted[i]
+            return orjson.dumps({**commit_data, 'files_changed': [{**file_data, 'patch': None} for file_data in commit_data['files_changed']]}).decode()
+        
+        def payload() -> str:
+            return '[' + ','.join(fragments) + ']'
+        
+        total = sum(self._fragment_tokens(fragment) for fragment in fragments) + len(fragments) + 1
+        if total <= max_tokens:
+            return payload(), True
+        
+        # Strip the oldest commits one at a time until the estimate fits
+        original = list(fragments)
+        timestamps = [commit_data['timestamp'] for commit_data in compacted]
+        for i in sorted(range(len(compacted)), key=timestamps.__getitem__):
+            fragments[i] = stripped(i)
+            total -= self._fragment_tokens(original[i]) - self._fragment_tokens(fragments[i])
+            if total <= max_tokens:
+                return payload(), True
+        
+        return '[' + ','.join(original) + ']', False
+    
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop used for async GitHub requests, starting it on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='github-audit-async', daemon=True).start()
+                self._loop = loop
+        return self._loop
+    
+    async def _github_get(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str, max_retries: int = 3) -> Dict:
+        """GET a GitHub REST URL, waiting out primary and secondary rate limits.
+        
+        Once a response shows the rate-limit reserve is reached, all further
+        requests wait for the window to reset instead of spending it.
+        """
+        for attempt in range(max_retries + 1):
+            pause = self._rate_limited_until - time.time()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            
+            async with semaphore:
+                response = await client.get(url)
+            
+            pause = _response_rate_limit_pause(response.headers)
+            if pause:
+                self._rate_limited_until = max(self._rate_limited_until, time.time() + pause)
+            
+            if response.status_code in (403, 429) and attempt < max_retries:
+                delay = _rate_limit_delay(response.headers)
+                if delay is not None:
+                    await asyncio.sleep(delay)
+                    continue
+            
+            response.raise_for_status()
+            return response.json()
+    
+    async def _afetch_diff(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, commit) -> Optional[Dict]:
+        """Fetch the diff data for a single commit from the API, or None if it could not be fetched."""
+        try:
+            data = await self._github_get(client, semaphore, commit.url)
+        except RateLimitError:
+            raise
+        except Exception as e:
+            click.echo(f"{Fore.YELLOW}Warning: Could not get diff for commit {commit.sha[:8]}: {e}{Style.RESET_ALL}")
+            return None
+        
+        commit_data = {
+            'sha': commit.sha[:8],
+            'message': commit.message,
+            'timestamp': commit.date.isoformat(),
+            'files_changed': [
+                {
+                    'filename': file['filename'],
+                    'status': file['status'],
+                    'additions': file['additions'],
+                    'deletions': file['deletions'],
+                    'patch': file.get('patch') or None
+                }
+                for file in data.get('files', [])
+            ]
+        }
+        return commit_data
+    
+    def _stored_diffs(self, commits: List) -> List[Optional[Dict]]:
+        """Diff data saved in the disk cache for each commit, or None where there is none."""
+        stored = (self.disk_cache.get(_commit_diff_key(commit)) for commit in commits)
+        return [orjson.loads(value) if value is not None else None for value in stored]
+    
+    def _store_diffs(self, fetched: List[Tuple[Any, Dict]]) -> None:
+        """Save freshly fetched (commit, diff data) pairs to the disk cache."""
+        for commit, commit_data in fetched:
+            self.disk_cache.set(_commit_diff_key(commit), orjson.dumps(commit_data).decode())
+    
+    async def _afetch_diffs_payload(self, commits: List, max_tokens: int) -> Tuple[str, bool]:
+        """Fetch all commit diffs concurrently and build the diff payload."""
+        headers = {
+            'Authorization': f'Bearer {self._github_token}',
+            'Accept': 'application/vnd.github+json'
+        }
+        semaphore = asyncio.Semaphore(MAX_ASYNC_REQUESTS)
+        
+        # SQLite access, serialization and tokenizing block, so they run off the event loop
+        loop = asyncio.get_running_loop()
+        stored = await loop.run_in_executor(None, self._stored_diffs, commits)
+        missing = [commit for commit, commit_data in zip(commits, stored) if commit_data is None]
+        
+        fetched = []
+        if missing:
+            async with httpx.AsyncClient(headers=headers, timeout=30) as client:
+                results = await asyncio.gather(*(self._afetch_diff(client, semaphore, commit) for commit in missing))
+            fetched = [(commit, commit_data) for commit, commit_data in zip(missing, results) if commit_data is not None]
+            await loop.run_in_executor(None, self._store_diffs, fetched)
+        
+        # Keep the commits' order, whether their diff was stored or just fetched
+        fresh = {commit.sha: commit_data for commit, commit_data in fetched}
+        all_diffs = [commit_data if commit_data is not None else fresh.get(commit.sha) for commit, commit_data in zip(commits, stored)]
+        all_diffs = [commit_data for commit_data in all_diffs if commit_data is not None]
+        return await loop.run_in_executor(None, self._fit_diffs, all_diffs, max_tokens)
+    
+    def get_commit_diffs_async(self, commits: List, max_tokens: int = 100000) -> Future:
+        """Start fetching diffs for all commits on the background event loop.
+        
+        Returns a concurrent.futures.Future that resolves to the same
+        (diff_json, within_limit) tuple as get_commit_diffs.
+        """
+        return asyncio.run_coroutine_threadsafe(self._afetch_diffs_payload(commits, max_tokens), self._get_event_loop())
+    
+    def _chat_completion(self, system_prompt: str, prompt: str, on_delta: Optional[Callable[[str], None]] = None) -> str:
+        """Run a chat completion, reusing the stored answer if this exact prompt was sent before.
+        
+        When on_delta is given the response is streamed and each piece of text
+        is passed to it as soon as it arrives.
+        """
+        cache_key = f"ai:{OPENAI_MODEL}:{_digest(system_prompt + chr(0) + prompt)}"
+        cached = self.disk_cache.get(cache_key)
+        if cached is not None:
+            if on_delta:
+                on_delta(cached)
+            return cached
+        
+        response = self.openai_client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=5500,
+            temperature=0.3,
+            stream=on_delta is not None
+        )
+        
+        if on_delta is None:
+            content = response.choices[0].message.content.strip()
         else:
-            date_str = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+            parts = []
+            for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    on_delta(delta)
+                    parts.append(delta)
+            content = "".join(parts).strip()
+        
+        self.disk_cache.set(cache_key, content)
+        return content
+    
+    async def _achat_completion(self, system_prompt: str, prompt: str, queue: Optional[asyncio.Queue] = None) -> str:
+        """Async version of _chat_completion.
         
-        data_type = "detailed Git commit data with diffs" if is_full_diff else "Git commit messages and metadata"
+        When queue is given the response is streamed and each piece of text is
+        put on it as it arrives, followed by None once the answer is complete.
+        """
+        cache_key = f"ai:{OPENAI_MODEL}:{_digest(system_prompt + chr(0) + prompt)}"
+        cached = self.disk_cache.get(cache_key)
+        if cached is not None:
+            if queue is not None:
+                await queue.put(cached)
+                await queue.put(None)
+            return cached
         
-        # Base prompt for the changelist
-        base_prompt = f"""
-You are a professional software developer writing an end-of-day work report for a client.
-
-Based on the following {data_type} from {date_str}, please generate a clear, professional changelist that summarizes the work completed. 
-
-Format the response as a client-friendly report with:
-1. A brief summary of the work period
-2. Key features/changes implemented
-3. Bug fixes or improvements made
-4. Any technical details that might be relevant - but make sure not to be too technical. This is for a non-technical audience. Don't quote filenames or anything like that. Keep it digestible.
-
-Make it sound professional and client-appropriate, avoiding overly technical jargon where possible.
-"""
-
-        # Add voice/tone instruction if provided
-        if voice:
-            voice_instruction = f"""
-IMPORTANT: Please write this report with the following tone/voice: {voice}
-
-Make sure the entire report reflects this requested tone.
-"""
-            base_prompt += voice_instruction
-
-        # Add format-specific instructions
-        if output_format.lower() == 'markdown':
-            format_instruction = """
-Please format your response using Markdown syntax. You may use headers, bullet points, code blocks, emphasis, and other Markdown formatting to make the report well-structured and readable.
-"""
-        else:  # text format
-            format_instruction = """
-Please format your response as plain text only. Do NOT use any Markdown formatting, asterisks for emphasis, hash symbols for headers, or any other special formatting characters. Use only plain text with proper spacing and line breaks for structure.
-"""
-
-        full_prompt = base_prompt + format_instruction + f"""
-Git commit data:
-{data}
-
-After the main report, provide a one paragraph summary of the work completed for the user's timesheet.
-
-Please provide a well-structured report:
-"""
-
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",
+            response = await self.async_openai_client.chat.completions.create(
+                model=OPENAI_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are a professional software developer writing client reports."},
-                    {"role": "user", "content": full_prompt}
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt}
                 ],
                 max_tokens=5500,
-                temperature=0.3
+                temperature=0.3,
+                stream=queue is not None
             )
             
-            return response.choices[0].message.content.strip()
-            
+            if queue is None:
+                content = response.choices[0].message.content.strip()
+            else:
+                parts = []
+                async for chunk in response:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        await queue.put(delta)
+                        parts.append(delta)
+                content = "".join(parts).strip()
+        finally:
+            if queue is not None:
+                await queue.put(None)
+        
+        self.disk_cache.set(cache_key, content)
+        return content
+    
+    def _changelist_prompt(self, data: str, date_range: Tuple[datetime, datetime], output_format: str, is_full_diff: bool, voice: Optional[str]) -> str:
+        """Build the OpenAI prompt for a changelist."""
+        return _build_prompt(_CHANGELIST_PROMPTS, _CHANGELIST_VOICE, data, date_range, output_format, is_full_diff, voice)
+
+    def generate_changelist_with_ai(self, data: str, date_range: Tuple[datetime, datetime], output_format: str = 'text', is_full_diff: bool = True, voice: Optional[str] = None,
+                                    on_delta: Optional[Callable[[str], None]] = None) -> str:
+        """Generate a professional changelist using OpenAI.
+        
+        Pass on_delta to receive the report text incrementally while it is generated.
+        """
+        full_prompt = self._changelist_prompt(data, date_range, output_format, is_full_diff, voice)
+        
+        try:
+            return self._chat_completion("You are a professional software developer writing client reports.", full_prompt, on_delta)
         except Exception as e:
             return f"Error generating AI changelist: {e}\n\nRaw commit data:\n{data}"
 
-    def generate_timeline_with_ai(self, data: str, date_range: Tuple[datetime, datetime], output_format: str = 'text', is_full_diff: bool = True, voice: Optional[str] = None) -> str:
-        """Generate a chronological development timeline using OpenAI."""
+    async def generate_changelist_with_ai_async(self, data: str, date_range: Tuple[datetime, datetime], output_format: str = 'text', is_full_diff: bool = True, voice: Optional[str] = None,
+                                                queue: Optional[asyncio.Queue] = None) -> str:
+        """Async version of generate_changelist_with_ai; streams into queue when one is given."""
+        full_prompt = self._changelist_prompt(data, date_range, output_format, is_full_diff, voice)
         
-        start_date, end_date = date_range
-        if start_date.date() == end_date.date():
-            date_str = start_date.strftime('%Y-%m-%d')
-        else:
-            date_str = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+        try:
+            return await self._achat_completion("You are a professional software developer writing client reports.", full_prompt, queue)
+        except Exception as e:
+            return f"Error generating AI changelist: {e}\n\nRaw commit data:\n{data}"
+
+    async def _reports_for_commits(self, commits: List, date_range: Tuple[datetime, datetime], output_format: str, verbose: bool, voice: Optional[str],
+                                   timeline: bool) -> Tuple[str, Optional[str]]:
+        """Fetch the commit data (full diffs if verbose) and generate a changelist, and optionally a timeline, from it."""
+        is_full_diff = False
+        if verbose:
+            diffs, within_limit = await self._afetch_diffs_payload(commits, 100000)
+            if within_limit:
+                commit_data, is_full_diff = diffs, True
+            else:
+                click.echo(f"{Fore.YELLOW}Warning: Full diffs exceed token limit (>100k tokens). Falling back to commit messages only.{Style.RESET_ALL}")
+        # Fetching file lists (REST calls) and tokenizing block, so both run off the shared event loop
+        loop = asyncio.get_running_loop()
+        if not is_full_diff:
+            commit_data = await loop.run_in_executor(None, self.get_commit_messages_only, commits)
         
-        data_type = "detailed Git commit data with diffs" if is_full_diff else "Git commit messages and metadata"
+        token_count = await loop.run_in_executor(None, functools.partial(self.count_tokens, commit_data, limit=128000))
+        if token_count > 128000:  # 128k token limit
+            raise ValueError(f"Commit data ({token_count:,} tokens) exceeds maximum limit (128k tokens). Try using a smaller date range or fewer commits.")
         
-        # Base prompt for the timeline
-        base_prompt = f"""
-You are a technical project historian documenting the development timeline of a software project.
-
-Based on the following {data_type} from {date_str}, please generate a comprehensive development timeline that tells the story of how this project evolved chronologically.
-
-Create a historical narrative that includes:
-1. **Chronological Development Story** - Show the progression of work over time
-2. **Feature Evolution** - Highlight when major features and capabilities were introduced
-3. **Development Milestones** - Identify key moments and breakthroughs in the development process
-4. **Technical Progress** - Document how the codebase and architecture evolved
-5. **Work Patterns** - Note significant development phases or focus areas
-
-**IMPORTANT**: For each major development phase or feature mentioned, include the specific dates when that work occurred. This timeline should read like a project history that someone could use to understand how and when the project developed.
-
-Structure this as a narrative timeline that flows chronologically, making it clear what happened when. Focus on the evolution and progression of the project rather than just listing individual changes.
-"""
+        changelist = self.generate_changelist_with_ai_async(commit_data, date_range, output_format, is_full_diff, voice)
+        if not timeline:
+            return await changelist, None
+        
+        # Both reports are built from the same data, so send the two requests together
+        return tuple(await asyncio.gather(
+            changelist, self.generate_timeline_with_ai_async(commit_data, date_range, output_format, is_full_diff, voice)))
 
-        # Add voice/tone instruction if provided
-        if voice:
-            voice_instruction = f"""
-IMPORTANT: Please write this timeline with the following tone/voice: {voice}
+    def generate_reports_for_commits_async(self, commits: List, date_range: Tuple[datetime, datetime], output_format: str = 'text', verbose: bool = False, voice: Optional[str] = None,
+                                           timeline: bool = False) -> Future:
+        """Start building a changelist (and a timeline if requested) for commits on the background event loop.
+        
+        Fetching diffs (if verbose) and the AI requests run while the caller
+        does other work; returns a concurrent.futures.Future for a
+        (changelist, timeline) tuple, with timeline None unless requested.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._reports_for_commits(commits, date_range, output_format, verbose, voice, timeline), self._get_event_loop())
 
-Make sure the entire timeline reflects this requested tone while maintaining chronological accuracy.
-"""
-            base_prompt += voice_instruction
+    async def _generate_changelists_async(self, jobs: List[Tuple[str, Tuple[datetime, datetime]]], output_format: str, is_full_diff: bool, voice: Optional[str],
+                                          on_delta: Optional[Callable[[int, str], None]] = None) -> List[str]:
+        """Generate one changelist per (data, date_range) job, at most MAX_AI_REQUESTS at a time."""
+        semaphore = asyncio.Semaphore(MAX_AI_REQUESTS)
+        
+        async def generate(data, date_range, queue=None):
+            async with semaphore:
+                return await self.generate_changelist_with_ai_async(data, date_range, output_format, is_full_diff, voice, queue)
+        
+        if on_delta is None:
+            return await asyncio.gather(*(generate(data, date_range) for data, date_range in jobs))
+        
+        # All jobs run concurrently; their text is replayed in job order as it arrives
+        queues = [asyncio.Queue() for _ in jobs]
+        tasks = [asyncio.ensure_future(generate(data, date_range, queue)) for (data, date_range), queue in zip(jobs, queues)]
+        for index, queue in enumerate(queues):
+            streamed = False
+            while (delta := await queue.get()) is not None:
+                on_delta(index, delta)
+                streamed = True
+            if not streamed:
+                # Nothing was streamed (e.g. the request failed), show the final text instead
+                on_delta(index, await tasks[index])
+        return await asyncio.gather(*tasks)
 
-        # Add format-specific instructions
-        if output_format.lower() == 'markdown':
-            format_instruction = """
-Please format your response using Markdown syntax. Use headers for different time periods, bullet points for key developments, code blocks if needed, and other Markdown formatting to create a well-structured, readable timeline.
-"""
-        else:  # text format
-            format_instruction = """
-Please format your response as plain text only. Do NOT use any Markdown formatting, asterisks for emphasis, hash symbols for headers, or any other special formatting characters. Use only plain text with proper spacing and line breaks for structure.
-"""
+    def generate_changelists_with_ai(self, jobs: List[Tuple[str, Tuple[datetime, datetime]]], output_format: str = 'text', is_full_diff: bool = True, voice: Optional[str] = None,
+                                     on_delta: Optional[Callable[[int, str], None]] = None) -> List[str]:
+        """Generate several changelists concurrently; results keep the order of ``jobs``.
+        
+        Pass on_delta to receive (job index, text) pieces while the reports are
+        generated; reports are delivered one after another in job order.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._generate_changelists_async(jobs, output_format, is_full_diff, voice, on_delta), self._get_event_loop())
+        return future.result()
 
-        full_prompt = base_prompt + format_instruction + f"""
-Git commit data (chronologically ordered):
-{data}
+    def _timeline_prompt(self, data: str, date_range: Tuple[datetime, datetime], output_format: str, is_full_diff: bool, voice: Optional[str]) -> str:
+        """Build the OpenAI prompt for a development timeline."""
+        return _build_prompt(_TIMELINE_PROMPTS, _TIMELINE_VOICE, data, date_range, output_format, is_full_diff, voice)
 
-Please provide a comprehensive development timeline:
-"""
+    def generate_timeline_with_ai(self, data: str, date_range: Tuple[datetime, datetime], output_format: str = 'text', is_full_diff: bool = True, voice: Optional[str] = None) -> str:
+        """Generate a chronological development timeline using OpenAI."""
+        full_prompt = self._timeline_prompt(data, date_range, output_format, is_full_diff, voice)
+        
+        try:
+            return self._chat_completion("You are a technical project historian creating development timelines.", full_prompt)
+        except Exception as e:
+            return f"Error generating AI timeline: {e}\n\nRaw commit data:\n{data}"
 
+    async def generate_timeline_with_ai_async(self, data: str, date_range: Tuple[datetime, datetime], output_format: str = 'text', is_full_diff: bool = True, voice: Optional[str] = None,
+                                              queue: Optional[asyncio.Queue] = None) -> str:
+        """Async version of generate_timeline_with_ai; streams into queue when one is given."""
+        full_prompt = self._timeline_prompt(data, date_range, output_format, is_full_diff, voice)
+        
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": "You are a technical project historian creating development timelines."},
-                    {"role": "user", "content": full_prompt}
-                ],
-                max_tokens=5500,
-                temperature=0.3
-            )
-            
-            return response.choices[0].message.content.strip()
-            
+            return await self._achat_completion("You are a technical project historian creating development timelines.", full_prompt, queue)
         except Exception as e:
             return f"Error generating AI timeline: {e}\n\nRaw commit data:\n{data}"
 
@@ -600,27 +1529,11 @@ Please provide a comprehensive development timeline:
         # Handle original date input for special cases
         original_input = date_input.lower().strip() if date_input else None
         
-        # Check if it's a single date or date range
-        if start_date.date() == end_date.date():
-            # Single date
-            if original_input == 'today':
-                date_part = 'today'
-            elif original_input == 'yesterday':
-                date_part = 'yesterday'
-            else:
+        # Keywords keep their name, anything else is spelled out as dates
+        date_part = _DATE_ALIASES.get(original_input)
+        if date_part is None:
+            if start_date.date() == end_date.date():
                 date_part = start_date.strftime('%Y-%m-%d')
-        else:
-            # Date range
-            if original_input in ['all', 'alltime', 'all-time']:
-                date_part = 'alltime'
-            elif original_input in ['week', 'this-week']:
-                date_part = 'thisweek'
-            elif original_input == 'last-week':
-                date_part = 'lastweek'
-            elif original_input in ['month', 'this-month']:
-                date_part = 'thismonth'
-            elif original_input == 'last-month':
-                date_part = 'lastmonth'
             else:
                 # Custom date range
                 start_str = start_date.strftime('%Y-%m-%d')
@@ -636,6 +1549,31 @@ Please provide a comprehensive development timeline:
             f.write("="*len(report_title) + "\n\n")
             f.write(content)
     
+    def format_commit_summary(self, commits: List, date_display: str, output_format: str = 'text') -> str:
+        """Format a plain chronological summary of commits, used instead of an AI report for tiny inputs."""
+        sorted_commits = sorted(commits, key=_by_timestamp)
+        subjects = [commit.message.partition('\n')[0].strip() for commit in sorted_commits]
+        commit_word = 'commit' if len(commits) == 1 else 'commits'
+        
+        lines = []
+        if output_format.lower() == 'markdown':
+            lines.append("## Work Completed")
+            lines.append("")
+            for commit, subject in zip(sorted_commits, subjects):
+                lines.append(f"- **{commit.date.strftime('%Y-%m-%d %H:%M')}** - {subject}")
+            lines.append("")
+            lines.append("## Timesheet Summary")
+            lines.append("")
+        else:
+            lines.append("Work Completed:")
+            for commit, subject in zip(sorted_commits, subjects):
+                lines.append(f"  {commit.date.strftime('%Y-%m-%d %H:%M')} - {subject}")
+            lines.append("")
+            lines.append("Timesheet Summary:")
+        lines.append(f"{len(commits)} {commit_word} for {date_display}: {'; '.join(subjects)}.")
+        
+        return "\n".join(lines)
+    
     def format_hours_report(self, commits: List, date_display: str, 
                            start_date: datetime, end_date: datetime, 
                            output_format: str = 'text') -> str:
@@ -644,49 +1582,46 @@ Please provide a comprehensive development timeline:
         if not commits:
             return "No commits found for the specified date range."
         
-        # Calculate hours for entire range
-        total_hours, first_commit, last_commit, work_blocks = self.calculate_work_hours(commits)
+        is_markdown = output_format.lower() == 'markdown'
         
         lines = []
         
         if start_date.date() != end_date.date():
-            # Multi-day analysis
-            # Group commits by day
-            commits_by_day = defaultdict(list)
-            for commit in commits:
-                day = commit.commit.author.date.date()
-                commits_by_day[day].append(commit)
-            
-            if output_format.lower() == 'markdown':
+            # Multi-day analysis: the per-day pass gives every number reported here
+            hours_by_day = self.calculate_work_hours_by_day(commits)
+            first_commit = min(commits, key=_by_timestamp).date
+            last_commit = max(commits, key=_by_timestamp).date
+            commit_range = f"{first_commit.strftime('%Y-%m-%d %H:%M UTC')} - {last_commit.strftime('%Y-%m-%d %H:%M UTC')}"
+            
+            if is_markdown:
                 lines.append(f"## Summary")
                 lines.append(f"- **Total commits:** {len(commits)}")
-                lines.append(f"- **Date range:** {first_commit.strftime('%Y-%m-%d %H:%M UTC')} - {last_commit.strftime('%Y-%m-%d %H:%M UTC')}")
+                lines.append(f"- **Date range:** {commit_range}")
                 lines.append("")
                 lines.append("## Daily Breakdown")
                 lines.append("")
             else:
                 lines.append(f"Total commits: {len(commits)}")
-                lines.append(f"Date range: {first_commit.strftime('%Y-%m-%d %H:%M UTC')} - {last_commit.strftime('%Y-%m-%d %H:%M UTC')}")
+                lines.append(f"Date range: {commit_range}")
                 lines.append("")
                 lines.append("Daily Breakdown:")
                 
             daily_total = 0
-            for day in sorted(commits_by_day.keys()):
-                day_commits = commits_by_day[day]
-                day_hours, _, _, _ = self.calculate_work_hours(day_commits)
+            for day, (day_hours, day_commit_count) in hours_by_day.items():
                 daily_total += day_hours
-                day_name = day.strftime('%A')
+                day_str = day.isoformat()
+                day_name = _WEEKDAYS[day.weekday()]
                 hours_display = self._format_hours_display(day_hours)
                 
-                if output_format.lower() == 'markdown':
-                    lines.append(f"- **{day.strftime('%Y-%m-%d')} ({day_name}):** {hours_display} ({len(day_commits)} commits)")
+                if is_markdown:
+                    lines.append(f"- **{day_str} ({day_name}):** {hours_display} ({day_commit_count} commits)")
                 else:
-                    lines.append(f"  {day.strftime('%Y-%m-%d')} ({day_name}): {hours_display} ({len(day_commits)} commits)")
+                    lines.append(f"  {day_str} ({day_name}): {hours_display} ({day_commit_count} commits)")
             
             lines.append("")
             total_hours_display = self._format_hours_display(daily_total)
             
-            if output_format.lower() == 'markdown':
+            if is_markdown:
                 lines.append(f"## Total")
                 lines.append(f"**📊 Total estimated hours worked:** {total_hours_display}")
             else:
@@ -694,7 +1629,9 @@ Please provide a comprehensive development timeline:
                 
         else:
             # Single day analysis
-            if output_format.lower() == 'markdown':
+            total_hours, first_commit, last_commit, work_blocks = self.calculate_work_hours(commits)
+            
+            if is_markdown:
                 lines.append(f"## Summary")
                 lines.append(f"- **Total commits:** {len(commits)}")
                 lines.append(f"- **First commit:** {first_commit.strftime('%H:%M:%S UTC')}")
@@ -710,20 +1647,20 @@ Please provide a comprehensive development timeline:
                 lines.append("Commit Summary:")
             
             # Show commit summary (limit to last 20 commits for readability)
-            commits_to_show = commits[-20:]
-            start_index = len(commits) - len(commits_to_show) + 1
+            start = max(0, len(commits) - 20)
             
             if len(commits) > 20:
-                if output_format.lower() == 'markdown':
+                if is_markdown:
                     lines.append("_(showing last 20 of {} commits)_".format(len(commits)))
                 else:
                     lines.append(f"  ... (showing last 20 of {len(commits)} commits)")
             
-            for i, commit in enumerate(commits_to_show, start_index):
-                timestamp = commit.commit.author.date.strftime('%H:%M')
-                message = commit.commit.message.split('\n')[0][:60]
+            for i in range(start + 1, len(commits) + 1):
+                commit = commits[i - 1]
+                timestamp = _clock_time(commit.date)
+                message = commit.message.partition('\n')[0][:60]
                 
-                if output_format.lower() == 'markdown':
+                if is_markdown:
                     lines.append(f"{i}. **{timestamp}** - {message}")
                 else:
                     lines.append(f"  {i:2d}. {timestamp} - {message}")
@@ -731,7 +1668,7 @@ Please provide a comprehensive development timeline:
             lines.append("")
             
             # Work blocks analysis
-            if output_format.lower() == 'markdown':
+            if is_markdown:
                 lines.append(f"## Work Blocks Analysis")
                 lines.append(f"*{len(work_blocks)} blocks detected*")
                 lines.append("")
@@ -739,19 +1676,19 @@ Please provide a comprehensive development timeline:
                 lines.append(f"Work Blocks Analysis ({len(work_blocks)} blocks detected):")
             
             for i, block in enumerate(work_blocks, 1):
-                start_time = block['start'].strftime('%H:%M')
-                end_time = block['end'].strftime('%H:%M')
+                start_time = _clock_time(block['start'])
+                end_time = _clock_time(block['end'])
                 hours = block['hours']
                 commit_count = block['commits']
                 hours_display = self._format_hours_display(hours)
                 
                 if start_time == end_time:
-                    if output_format.lower() == 'markdown':
+                    if is_markdown:
                         lines.append(f"- **Block {i}:** {start_time} (isolated commit - {hours_display})")
                     else:
                         lines.append(f"  Block {i}: {start_time} (isolated commit - {hours_display})")
                 else:
-                    if output_format.lower() == 'markdown':
+                    if is_markdown:
                         lines.append(f"- **Block {i}:** {start_time} - {end_time} ({hours_display}, {commit_count} commits)")
                     else:
                         lines.append(f"  Block {i}: {start_time} - {end_time} ({hours_display}, {commit_count} commits)")
@@ -759,7 +1696,7 @@ Please provide a comprehensive development timeline:
             lines.append("")
             total_hours_display = self._format_hours_display(total_hours)
             
-            if output_format.lower() == 'markdown':
+            if is_markdown:
                 lines.append(f"## Total")
                 lines.append(f"**📊 Total estimated hours worked:** {total_hours_display}")
             else:
@@ -772,8 +1709,16 @@ Please provide a comprehensive development timeline:
         """Format rhythm analysis as a report string."""
         
         lines = []
+        is_markdown = output_format.lower() == 'markdown'
         
-        if output_format.lower() == 'markdown':
+        hourly_commits = rhythm_data['hourly_commits']
+        daily_commits = rhythm_data['daily_commits']
+        daily_hours = rhythm_data['daily_hours']
+        # The peak counts found by analyze_coding_rhythm are the chart maxima
+        max_hourly = rhythm_data['peak_hour'][1] or 1
+        max_daily = rhythm_data['peak_day'][1] or 1
+        
+        if is_markdown:
             lines.append("## Summary")
             lines.append(f"- **Total commits:** {rhythm_data['total_commits']}")
             lines.append(f"- **Active days:** {rhythm_data['total_days']}")
@@ -797,33 +1742,22 @@ Please provide a comprehensive development timeline:
             # Hourly breakdown
             lines.append("## Hourly Commit Pattern")
             lines.append("")
-            hourly_commits = rhythm_data['hourly_commits']
-            max_hourly = max(hourly_commits.values()) if hourly_commits else 1
             
-            for hour in range(24):
-                count = hourly_commits.get(hour, 0)
-                if count > 0:
-                    bar_length = int((count / max_hourly) * 20)
-                    bar = '█' * bar_length
-                    lines.append(f"- **{hour:02d}:00** | {bar} | {count} commits")
+            for hour, count in sorted(hourly_commits.items()):
+                bar = _bar(count, max_hourly, 20)
+                lines.append(f"- **{hour:02d}:00** | {bar} | {count} commits")
             
             lines.append("")
             
             # Daily breakdown
             lines.append("## Weekly Commit Pattern")
             lines.append("")
-            daily_commits = rhythm_data['daily_commits']
-            daily_hours = rhythm_data['daily_hours']
-            
-            days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            max_daily = max(daily_commits.values()) if daily_commits else 1
             
-            for day in days_order:
+            for day in _WEEKDAYS:
                 commits_count = daily_commits.get(day, 0)
                 hours_count = daily_hours.get(day, 0)
                 if commits_count > 0:
-                    bar_length = int((commits_count / max_daily) * 15)
-                    bar = '█' * bar_length
+                    bar = _bar(commits_count, max_daily, 15)
                     hours_display = self._format_hours_display(hours_count)
                     lines.append(f"- **{day}** | {bar} | {commits_count} commits ({hours_display})")
                 else:
@@ -856,32 +1790,21 @@ Please provide a comprehensive development timeline:
             
             # Hourly breakdown
             lines.append("⏰ Hourly Commit Pattern:")
-            hourly_commits = rhythm_data['hourly_commits']
-            max_hourly = max(hourly_commits.values()) if hourly_commits else 1
             
-            for hour in range(24):
-                count = hourly_commits.get(hour, 0)
-                if count > 0:
-                    bar_length = int((count / max_hourly) * 20)
-                    bar = '█' * bar_length
-                    lines.append(f"  {hour:02d}:00 │{bar:<20}│ {count} commits")
+            for hour, count in sorted(hourly_commits.items()):
+                bar = _bar(count, max_hourly, 20)
+                lines.append(f"  {hour:02d}:00 │{bar:<20}│ {count} commits")
             
             lines.append("")
             
             # Daily breakdown
             lines.append("📅 Weekly Commit Pattern:")
-            daily_commits = rhythm_data['daily_commits']
-            daily_hours = rhythm_data['daily_hours']
-            
-            days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            max_daily = max(daily_commits.values()) if daily_commits else 1
             
-            for day in days_order:
+            for day in _WEEKDAYS:
                 commits_count = daily_commits.get(day, 0)
                 hours_count = daily_hours.get(day, 0)
                 if commits_count > 0:
-                    bar_length = int((commits_count / max_daily) * 15)
-                    bar = '█' * bar_length
+                    bar = _bar(commits_count, max_daily, 15)
                     hours_display = self._format_hours_display(hours_count)
                     lines.append(f"  {day:<9} │{bar:<15}│ {commits_count} commits ({hours_display})")
                 else:
@@ -891,12 +1814,9 @@ Please provide a comprehensive development timeline:
             lines.append("💡 Insights:")
         
         # Generate insights (same for both formats)
-        hourly_commits = rhythm_data['hourly_commits']
-        daily_commits = rhythm_data['daily_commits']
         
         # Find most productive time blocks
         if hourly_commits:
-            max_hourly = max(hourly_commits.values())
             productive_hours = [h for h, c in hourly_commits.items() if c >= max_hourly * 0.7]
             if productive_hours:
                 if len(productive_hours) == 1:
@@ -906,7 +1826,7 @@ Please provide a comprehensive development timeline:
                     end_hour = max(productive_hours)
                     insight = f"Your peak productivity window is {start_hour:02d}:00-{end_hour:02d}:00"
                 
-                if output_format.lower() == 'markdown':
+                if is_markdown:
                     lines.append(f"- {insight}")
                 else:
                     lines.append(f"  • {insight}")
@@ -920,26 +1840,25 @@ Please provide a comprehensive development timeline:
         else:
             pattern_insight = "You code across long hours - consider work-life balance"
         
-        if output_format.lower() == 'markdown':
+        if is_markdown:
             lines.append(f"- {pattern_insight}")
         else:
             lines.append(f"  • {pattern_insight}")
         
         # Weekly pattern insights
-        weekday_commits = sum(daily_commits.get(day, 0) for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'])
-        weekend_commits = sum(daily_commits.get(day, 0) for day in ['Saturday', 'Sunday'])
+        weekday_commits = sum(daily_commits.get(day, 0) for day in _WORKDAYS)
+        weekend_commits = sum(daily_commits.get(day, 0) for day in _WEEKEND)
         
         if weekend_commits > weekday_commits * 0.3:
             weekend_insight = f"High weekend activity detected - {weekend_commits} weekend commits"
-            if output_format.lower() == 'markdown':
+            if is_markdown:
                 lines.append(f"- {weekend_insight}")
             else:
                 lines.append(f"  • {weekend_insight}")
         
-        max_daily = max(daily_commits.values()) if daily_commits else 0
         if daily_commits.get('Monday', 0) > max_daily * 0.8:
             monday_insight = "Strong Monday momentum - you start weeks well!"
-            if output_format.lower() == 'markdown':
+            if is_markdown:
                 lines.append(f"- {monday_insight}")
             else:
                 lines.append(f"  • {monday_insight}")
@@ -953,9 +1872,6 @@ Please provide a comprehensive development timeline:
         
         # Basic stats
         total_commits = len(commits)
-        sorted_commits = sorted(commits, key=lambda c: c.commit.author.date)
-        first_commit = sorted_commits[0]
-        last_commit = sorted_commits[-1]
         
         # Get repository creation date
         try:
@@ -974,52 +1890,67 @@ Please provide a comprehensive development timeline:
         # Calculate work hours
         total_hours, _, _, work_blocks = self.calculate_work_hours(commits)
         
-        # File change statistics
+        # Listing each commit's files is a REST request, so load them concurrently first
+        self._prefetch_files(commits)
+        
+        # One pass over the commits for everything else: first/last commit,
+        # file changes, message lengths, per-day/week/month counts and authors
+        first_commit = last_commit = commits[0]
         total_files_changed = 0
         total_additions = 0
         total_deletions = 0
         file_types = defaultdict(int)
+        message_length_sum = 0
+        longest_message_length = shortest_message_length = len(commits[0].message)
+        commits_by_date = defaultdict(int)
+        weekly_commits = defaultdict(int)
+        monthly_commits = defaultdict(int)
+        unique_authors = set()
         
         for commit in commits:
+            if commit.timestamp < first_commit.timestamp:
+                first_commit = commit
+            if commit.timestamp >= last_commit.timestamp:
+                last_commit = commit
+            
             if hasattr(commit, 'files'):
                 total_files_changed += len(commit.files)
                 for file in commit.files:
                     total_additions += file.additions or 0
                     total_deletions += file.deletions or 0
-                    
-                    # Analyze file types
-                    if '.' in file.filename:
-                        ext = file.filename.split('.')[-1].lower()
-                        file_types[ext] += 1
-        
-        # Commit message analysis
-        commit_messages = [commit.commit.message for commit in commits]
-        avg_message_length = sum(len(msg) for msg in commit_messages) / len(commit_messages) if commit_messages else 0
-        
-        # Find longest and shortest messages
-        longest_message = max(commit_messages, key=len) if commit_messages else ""
-        shortest_message = min(commit_messages, key=len) if commit_messages else ""
+                    
+                    # Analyze file types (text after the last dot)
+                    _, dot, ext = file.filename.rpartition('.')
+                    if dot:
+                        file_types[ext.lower()] += 1
+            
+            # Commit message analysis
+            message_length = len(commit.message)
+            message_length_sum += message_length
+            if message_length > longest_message_length:
+                longest_message_length = message_length
+            if message_length < shortest_message_length:
+                shortest_message_length = message_length
+            
+            # Commit timing analysis
+            date = commit.date.date()
+            commits_by_date[date] += 1
+            weekly_commits[(date.toordinal() - 1) // 7] += 1  # Week number; ordinal 1 (0001-01-01) is a Monday
+            monthly_commits[(date.year, date.month)] += 1
+            
+            unique_authors.add(commit.author_name)
         
-        # Commit timing analysis
-        commits_by_date = defaultdict(list)
-        for commit in commits:
-            date = commit.commit.author.date.date()
-            commits_by_date[date].append(commit)
+        avg_message_length = message_length_sum / total_commits
         
         # Find busiest day
-        busiest_date = max(commits_by_date.items(), key=lambda x: len(x[1])) if commits_by_date else (None, [])
+        busiest_date = max(commits_by_date.items(), key=_by_count)
         
         # Calculate streaks
         consecutive_days = self._calculate_commit_streaks(commits_by_date)
         
         # Weekly/monthly analysis
-        weekly_stats = self._analyze_weekly_patterns(commits)
-        monthly_stats = self._analyze_monthly_patterns(commits)
-        
-        # Unique authors in the dataset
-        unique_authors = set()
-        for commit in commits:
-            unique_authors.add(commit.commit.author.name)
+        weekly_stats = self._analyze_weekly_patterns(weekly_commits)
+        monthly_stats = self._analyze_monthly_patterns(monthly_commits)
         
         # Time span analysis
         analysis_span_days = (end_date - start_date).days + 1
@@ -1053,7 +1984,7 @@ Please provide a comprehensive development timeline:
             
             # Peak activity
             'busiest_date': busiest_date[0],
-            'busiest_date_commits': len(busiest_date[1]),
+            'busiest_date_commits': busiest_date[1],
             'consecutive_days': consecutive_days,
             
             # Work patterns (from rhythm analysis)
@@ -1067,36 +1998,53 @@ Please provide a comprehensive development timeline:
             'total_deletions': total_deletions,
             'net_lines': total_additions - total_deletions,
             'file_types': dict(file_types),
+            'file_types_top': heapq.nlargest(10, file_types.items(), key=_by_count),  # Most touched first
             
             # Commit messages
             'avg_message_length': avg_message_length,
-            'longest_message': longest_message,
-            'shortest_message': shortest_message,
+            'longest_message_length': longest_message_length,
+            'shortest_message_length': shortest_message_length,
             
             # Weekly and monthly patterns
             'weekly_stats': weekly_stats,
             'monthly_stats': monthly_stats,
         }
     
+    def _prefetch_files(self, commits: List) -> None:
+        """Load the file lists of commits that do not have them yet, up to MAX_FETCH_WORKERS at a time."""
+        missing = [commit for commit in commits if getattr(commit, '_files', ()) is None]
+        if len(missing) < 2:
+            return
+        
+        def load(commit) -> None:
+            try:
+                commit.files
+            except Exception:
+                pass  # Raised again where the files are actually used
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(missing))) as pool:
+            list(pool.map(load, missing))
+    
     def _calculate_commit_streaks(self, commits_by_date: Dict) -> Dict:
         """Calculate consecutive day streaks."""
         if not commits_by_date:
             return {'longest_streak': 0, 'current_streak': 0}
         
-        dates = sorted(commits_by_date.keys())
+        # Day ordinals make "consecutive" a plain integer comparison
+        days = sorted(date.toordinal() for date in commits_by_date)
         longest_streak = 1
         current_streak = 1
         
-        for i in range(1, len(dates)):
-            if (dates[i] - dates[i-1]).days == 1:
+        for previous, day in zip(days, days[1:]):
+            if day == previous + 1:
                 current_streak += 1
-                longest_streak = max(longest_streak, current_streak)
+                if current_streak > longest_streak:
+                    longest_streak = current_streak
             else:
                 current_streak = 1
         
         # Check if current streak is ongoing (last commit was recent)
-        today = datetime.now().date()
-        if dates and (today - dates[-1]).days > 1:
+        if datetime.now().date().toordinal() - days[-1] > 1:
             current_streak = 0
         
         return {
@@ -1104,50 +2052,34 @@ Please provide a comprehensive development timeline:
             'current_streak': current_streak
         }
     
-    def _analyze_weekly_patterns(self, commits: List) -> Dict:
-        """Analyze weekly commit patterns."""
-        weekly_commits = defaultdict(list)
-        
-        for commit in commits:
-            # Get week start (Monday)
-            commit_date = commit.commit.author.date.date()
-            days_since_monday = commit_date.weekday()
-            week_start = commit_date - timedelta(days=days_since_monday)
-            weekly_commits[week_start].append(commit)
-        
+    def _analyze_weekly_patterns(self, weekly_commits: Dict) -> Dict:
+        """Analyze weekly commit patterns from commit counts keyed by week number (ordinal // 7, weeks start on Monday)."""
         if not weekly_commits:
             return {}
         
         # Find most productive week
-        most_productive_week = max(weekly_commits.items(), key=lambda x: len(x[1]))
+        most_productive_week = max(weekly_commits.items(), key=_by_count)
         
         return {
             'total_weeks': len(weekly_commits),
-            'avg_commits_per_week': sum(len(commits) for commits in weekly_commits.values()) / len(weekly_commits),
-            'most_productive_week': most_productive_week[0],
-            'most_productive_week_commits': len(most_productive_week[1])
+            'avg_commits_per_week': sum(weekly_commits.values()) / len(weekly_commits),
+            'most_productive_week': datetime.fromordinal(most_productive_week[0] * 7 + 1).date(),
+            'most_productive_week_commits': most_productive_week[1]
         }
     
-    def _analyze_monthly_patterns(self, commits: List) -> Dict:
-        """Analyze monthly commit patterns."""
-        monthly_commits = defaultdict(list)
-        
-        for commit in commits:
-            commit_date = commit.commit.author.date.date()
-            month_key = (commit_date.year, commit_date.month)
-            monthly_commits[month_key].append(commit)
-        
+    def _analyze_monthly_patterns(self, monthly_commits: Dict) -> Dict:
+        """Analyze monthly commit patterns from commit counts keyed by (year, month)."""
         if not monthly_commits:
             return {}
         
         # Find most productive month
-        most_productive_month = max(monthly_commits.items(), key=lambda x: len(x[1]))
+        most_productive_month = max(monthly_commits.items(), key=_by_count)
         
         return {
             'total_months': len(monthly_commits),
-            'avg_commits_per_month': sum(len(commits) for commits in monthly_commits.values()) / len(monthly_commits),
+            'avg_commits_per_month': sum(monthly_commits.values()) / len(monthly_commits),
             'most_productive_month': most_productive_month[0],
-            'most_productive_month_commits': len(most_productive_month[1])
+            'most_productive_month_commits': most_productive_month[1]
         }
     
     def format_stats_report(self, stats: Dict, date_display: str, output_format: str = 'text') -> str:
@@ -1156,8 +2088,9 @@ Please provide a comprehensive development timeline:
             return "No statistics available - no commits found for the specified period."
         
         lines = []
+        is_markdown = output_format.lower() == 'markdown'
         
-        if output_format.lower() == 'markdown':
+        if is_markdown:
             # Markdown format
             lines.append("# 📊 Repository Statistics Dashboard")
             lines.append("")
@@ -1198,8 +2131,8 @@ Please provide a comprehensive development timeline:
             
             # Timeline
             lines.append("## ⏰ Timeline")
-            lines.append(f"- **First Commit:** {stats['first_commit'].commit.author.date.strftime('%Y-%m-%d %H:%M UTC')}")
-            lines.append(f"- **Latest Commit:** {stats['last_commit'].commit.author.date.strftime('%Y-%m-%d %H:%M UTC')}")
+            lines.append(f"- **First Commit:** {stats['first_commit'].date.strftime('%Y-%m-%d %H:%M UTC')}")
+            lines.append(f"- **Latest Commit:** {stats['last_commit'].date.strftime('%Y-%m-%d %H:%M UTC')}")
             if stats['busiest_date']:
                 lines.append(f"- **🔥 Busiest Day:** {stats['busiest_date'].strftime('%Y-%m-%d')} ({stats['busiest_date_commits']} commits)")
             lines.append("")
@@ -1236,8 +2169,7 @@ Please provide a comprehensive development timeline:
             # File Types
             if stats['file_types']:
                 lines.append("## 📁 File Types Touched")
-                sorted_types = sorted(stats['file_types'].items(), key=lambda x: x[1], reverse=True)
-                for ext, count in sorted_types[:10]:  # Show top 10
+                for ext, count in stats['file_types_top']:
                     lines.append(f"- **.{ext}:** {count} files")
                 lines.append("")
             
@@ -1262,15 +2194,16 @@ Please provide a comprehensive development timeline:
                 
                 if stats.get('monthly_stats'):
                     monthly = stats['monthly_stats']
-                    month_name = datetime(monthly['most_productive_month'][0], monthly['most_productive_month'][1], 1).strftime('%B %Y')
+                    year, month = monthly['most_productive_month']
+                    month_name = f"{_MONTHS[month - 1]} {year}"
                     lines.append(f"- **Most Productive Month:** {month_name} ({monthly['most_productive_month_commits']} commits)")
                 lines.append("")
             
             # Commit Message Insights
             lines.append("## 💬 Commit Message Insights")
             lines.append(f"- **Average Length:** {stats['avg_message_length']:.0f} characters")
-            lines.append(f"- **Longest Message:** {len(stats['longest_message'])} characters")
-            lines.append(f"- **Shortest Message:** {len(stats['shortest_message'])} characters")
+            lines.append(f"- **Longest Message:** {stats['longest_message_length']} characters")
+            lines.append(f"- **Shortest Message:** {stats['shortest_message_length']} characters")
             lines.append("")
             
         else:
@@ -1315,8 +2248,8 @@ Please provide a comprehensive development timeline:
             
             # Timeline
             lines.append("⏰ Timeline:")
-            lines.append(f"  First Commit: {stats['first_commit'].commit.author.date.strftime('%Y-%m-%d %H:%M UTC')}")
-            lines.append(f"  Latest Commit: {stats['last_commit'].commit.author.date.strftime('%Y-%m-%d %H:%M UTC')}")
+            lines.append(f"  First Commit: {stats['first_commit'].date.strftime('%Y-%m-%d %H:%M UTC')}")
+            lines.append(f"  Latest Commit: {stats['last_commit'].date.strftime('%Y-%m-%d %H:%M UTC')}")
             if stats['busiest_date']:
                 lines.append(f"  🔥 Busiest Day: {stats['busiest_date'].strftime('%Y-%m-%d')} ({stats['busiest_date_commits']} commits)")
             lines.append("")
@@ -1353,8 +2286,7 @@ Please provide a comprehensive development timeline:
             # File Types
             if stats['file_types']:
                 lines.append("📁 File Types Touched:")
-                sorted_types = sorted(stats['file_types'].items(), key=lambda x: x[1], reverse=True)
-                for ext, count in sorted_types[:10]:  # Show top 10
+                for ext, count in stats['file_types_top']:
                     lines.append(f"  .{ext}: {count} files")
                 lines.append("")
             
@@ -1379,23 +2311,24 @@ Please provide a comprehensive development timeline:
                 
                 if stats.get('monthly_stats'):
                     monthly = stats['monthly_stats']
-                    month_name = datetime(monthly['most_productive_month'][0], monthly['most_productive_month'][1], 1).strftime('%B %Y')
+                    year, month = monthly['most_productive_month']
+                    month_name = f"{_MONTHS[month - 1]} {year}"
                     lines.append(f"  Most Productive Month: {month_name} ({monthly['most_productive_month_commits']} commits)")
                 lines.append("")
             
             # Commit Message Insights
             lines.append("💬 Commit Message Insights:")
             lines.append(f"  Average Length: {stats['avg_message_length']:.0f} characters")
-            lines.append(f"  Longest Message: {len(stats['longest_message'])} characters")
-            lines.append(f"  Shortest Message: {len(stats['shortest_message'])} characters")
+            lines.append(f"  Longest Message: {stats['longest_message_length']} characters")
+            lines.append(f"  Shortest Message: {stats['shortest_message_length']} characters")
             lines.append("")
         
         # Fun facts and insights (same for both formats)
-        lines.append("🎉 Fun Facts & Insights:" if output_format.lower() != 'markdown' else "## 🎉 Fun Facts & Insights")
-        if output_format.lower() == 'markdown':
+        lines.append("🎉 Fun Facts & Insights:" if not is_markdown else "## 🎉 Fun Facts & Insights")
+        if is_markdown:
             lines.append("")
         
-        prefix = "- " if output_format.lower() == 'markdown' else "  • "
+        prefix = "- " if is_markdown else "  • "
         
         # Calculate some fun statistics
         if stats['total_commits'] > 100:
@@ -1425,9 +2358,12 @@ Please provide a comprehensive development timeline:
         return '\n'.join(lines)
 
 def validate_environment():
-    """Validate that required environment variables are set."""
-    github_token = os.getenv('GITHUB_TOKEN')
-    openai_api_key = os.getenv('OPENAI_API_KEY')
+    """Validate that required environment variables are set.
+    
+    Returns (github_token, openai_api_key), or None after reporting what is missing.
+    """
+    github_token = get_env('GITHUB_TOKEN')
+    openai_api_key = get_env('OPENAI_API_KEY')
     
     missing = []
     if not github_token:
@@ -1438,9 +2374,23 @@ def validate_environment():
     if missing:
         click.echo(f"{Fore.RED}Error: Missing required environment variables: {', '.join(missing)}{Style.RESET_ALL}")
         click.echo(f"{Fore.YELLOW}Please set these in your .env file or environment.{Style.RESET_ALL}")
-        return False
+        return None
     
-    return True, github_token, openai_api_key
+    return github_token, openai_api_key
+
+def get_audit_tool() -> GitHubAuditTool:
+    """Return the audit tool passed in by an embedding caller (e.g. the GUI), or create one.
+    
+    Creating one validates the environment first and exits with status 1
+    when credentials are missing.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and isinstance(ctx.obj, dict) and ctx.obj.get('audit_tool') is not None:
+        return ctx.obj['audit_tool']
+    credentials = validate_environment()
+    if credentials is None:
+        sys.exit(1)
+    return GitHubAuditTool(*credentials)
 
 @click.group()
 def cli():
@@ -1459,23 +2409,17 @@ def cli():
 @click.option('--voice', help='Specify the tone/voice for the report (e.g., "friendly and upbeat", "formal and concise", "enthusiastic")')
 @click.option('--min-commit', help='Start analysis from this commit SHA (earliest commit to include)')
 @click.option('--max-commit', help='Stop analysis at this commit SHA (latest commit to include)')
-def changelist(repository, date, author, output, format, verbose, display_only, voice, min_commit, max_commit):
+@click.option('--ai-threshold', type=int, default=0, help='Write a plain summary locally instead of calling the AI when the commit data is under this many tokens and no --voice is given. Default: 0 (always use the AI)')
+def changelist(repository, date, author, output, format, verbose, display_only, voice, min_commit, max_commit, ai_threshold):
     """Generate an AI-powered changelist for a specific date or date range.
     
     By default, saves to an auto-generated markdown file to prevent wasting AI tokens.
     Use --display-only to show output without saving.
     """
     
-    # Validate environment
-    validation_result = validate_environment()
-    if not validation_result:
-        sys.exit(1)
-    
-    _, github_token, openai_api_key = validation_result
-    
     try:
         # Initialize the tool
-        audit_tool = GitHubAuditTool(github_token, openai_api_key)
+        audit_tool = get_audit_tool()
         
         # Parse date range
         start_date, end_date = audit_tool.parse_date_range(date)
@@ -1510,7 +2454,7 @@ def changelist(repository, date, author, output, format, verbose, display_only,
         # Get commit data based on verbose flag
         if verbose:
             click.echo(f"{Fore.BLUE}Extracting full diffs...{Style.RESET_ALL}")
-            diffs, within_limit = audit_tool.get_commit_diffs(commits)
+            diffs, within_limit = audit_tool.get_commit_diffs_async(commits).result()
             
             if not within_limit:
                 click.echo(f"{Fore.YELLOW}Warning: Full diffs exceed token limit (>100k tokens). Falling back to commit messages only.{Style.RESET_ALL}")
@@ -1525,7 +2469,7 @@ def changelist(repository, date, author, output, format, verbose, display_only,
             is_full_diff = False
         
         # Check token count
-        token_count = audit_tool.count_tokens(commit_data)
+        token_count = audit_tool.count_tokens(commit_data, limit=128000)
         if token_count > 128000:  # 128k token limit
             click.echo(f"{Fore.RED}Error: Commit data ({token_count:,} tokens) exceeds maximum limit (128k tokens).{Style.RESET_ALL}")
             click.echo(f"{Fore.YELLOW}Try using a smaller date range or fewer commits.{Style.RESET_ALL}")
@@ -1533,17 +2477,35 @@ def changelist(repository, date, author, output, format, verbose, display_only,
         
         click.echo(f"{Fore.BLUE}Using {token_count:,} tokens ({('full diffs' if is_full_diff else 'commit messages only')})...{Style.RESET_ALL}")
         
-        # Generate AI changelist with specified format
-        click.echo(f"{Fore.BLUE}Generating AI changelist ({format} format)...{Style.RESET_ALL}")
-        changelist_text = audit_tool.generate_changelist_with_ai(commit_data, (start_date, end_date), format, is_full_diff, voice)
+        use_ai = token_count >= ai_threshold or bool(voice)
+        if use_ai:
+            # Generate AI changelist with specified format
+            click.echo(f"{Fore.BLUE}Generating AI changelist ({format} format)...{Style.RESET_ALL}")
+        else:
+            click.echo(f"{Fore.BLUE}Commit data is under {ai_threshold:,} tokens, writing a summary without the AI...{Style.RESET_ALL}")
         
         # Save to file by default, unless display-only is specified
+        if display_only and use_ai:
+            # Display output only to console, streaming the report as it is generated
+            click.echo(_banner(f"CHANGELIST FOR {date_display.upper()} ({format.upper()} FORMAT)"))
+            streamed = []
+            
+            def show(text):
+                streamed.append(text)
+                click.echo(text, nl=False)
+            
+            changelist_text = audit_tool.generate_changelist_with_ai(commit_data, (start_date, end_date), format, is_full_diff, voice, on_delta=show)
+            # Errors are returned rather than streamed
+            click.echo("" if streamed else changelist_text)
+            return
+        
+        if use_ai:
+            changelist_text = audit_tool.generate_changelist_with_ai(commit_data, (start_date, end_date), format, is_full_diff, voice)
+        else:
+            changelist_text = audit_tool.format_commit_summary(commits, date_display, format)
+        
         if display_only:
-            # Display output only to console
-            click.echo(f"\n{Fore.GREEN}{'='*60}")
-            click.echo(f"CHANGELIST FOR {date_display.upper()} ({format.upper()} FORMAT)")
-            click.echo(f"{'='*60}{Style.RESET_ALL}\n")
-            click.echo(changelist_text)
+            click.echo(_banner(f"CHANGELIST FOR {date_display.upper()} ({format.upper()} FORMAT)") + "\n" + changelist_text)
         elif output is not None:
             # Custom filename provided
             report_title = f"CHANGELIST FOR {date_display.upper()} ({format.upper()} FORMAT)"
@@ -1551,7 +2513,7 @@ def changelist(repository, date, author, output, format, verbose, display_only,
             click.echo(f"\n{Fore.GREEN}Changelist saved to: {output}{Style.RESET_ALL}")
         else:
             # Default behavior: Auto-generate filename and save
-            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, 'changelist', repository, author, audit_tool.user.login, format)
+            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, 'changelist', repository, author, audit_tool.login, format)
             click.echo(f"{Fore.CYAN}Auto-generated filename: {output_filename}{Style.RESET_ALL}")
             
             report_title = f"CHANGELIST FOR {date_display.upper()} ({format.upper()} FORMAT)"
@@ -1566,6 +2528,90 @@ def changelist(repository, date, author, output, format, verbose, display_only,
         click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
         sys.exit(1)
 
+@cli.command('changelist-batch')
+@click.argument('repository')
+@click.option('--date', '-d', 'dates', multiple=True, required=True, help='Date/range to generate a changelist for (same formats as changelist). Repeat for each report')
+@click.option('--author', '-a', help='Specific author to filter commits. Default: authenticated user')
+@click.option('--format', '-f', type=click.Choice(['text', 'markdown'], case_sensitive=False), 
+              default='markdown', help='Output format: text (plain text) or markdown. Default: markdown')
+@click.option('--display-only', is_flag=True, help='Display output only (do not save to files)')
+@click.option('--voice', help='Specify the tone/voice for the reports (e.g., "friendly and upbeat", "formal and concise", "enthusiastic")')
+def changelist_batch(repository, dates, author, format, display_only, voice):
+    """Generate changelists for several dates at once.
+    
+    The AI requests for all dates run concurrently. Each report is built from
+    commit messages and saved to its own auto-generated file unless
+    --display-only is given.
+    """
+    
+    try:
+        # Initialize the tool
+        audit_tool = get_audit_tool()
+        
+        # Get repository
+        click.echo(f"{Fore.BLUE}Analyzing repository: {repository}{Style.RESET_ALL}")
+        repo = audit_tool.get_repository(repository)
+        
+        # Collect commit data for every date before starting the AI requests
+        reports = []
+        for date in dates:
+            start_date, end_date = audit_tool.parse_date_range(date)
+            
+            if start_date.date() == end_date.date():
+                date_display = start_date.strftime('%Y-%m-%d')
+            else:
+                date_display = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+            
+            click.echo(f"{Fore.BLUE}Getting commits for {date_display}...{Style.RESET_ALL}")
+            commits = audit_tool.get_commits_for_date_range(repo, start_date, end_date, author)
+            
+            if not commits:
+                click.echo(f"{Fore.YELLOW}No commits found for {date_display}{Style.RESET_ALL}")
+                continue
+            
+            commit_data = audit_tool.get_commit_messages_only(commits)
+            token_count = audit_tool.count_tokens(commit_data, limit=128000)
+            if token_count > 128000:  # 128k token limit
+                click.echo(f"{Fore.RED}Skipping {date_display}: commit data ({token_count:,} tokens) exceeds maximum limit (128k tokens).{Style.RESET_ALL}")
+                continue
+            
+            click.echo(f"{Fore.GREEN}Found {len(commits)} commits for {date_display} ({token_count:,} tokens){Style.RESET_ALL}")
+            reports.append((date, start_date, end_date, date_display, commit_data))
+        
+        if not reports:
+            return
+        
+        click.echo(f"{Fore.BLUE}Generating {len(reports)} AI changelists ({format} format)...{Style.RESET_ALL}")
+        jobs = [(commit_data, (start_date, end_date)) for _, start_date, end_date, _, commit_data in reports]
+        
+        if display_only:
+            # Stream each report to the console in date order as it is generated
+            shown = []
+            
+            def show(index, text):
+                if not shown or shown[-1] != index:
+                    if shown:
+                        click.echo("")
+                    click.echo(_banner(f"CHANGELIST FOR {reports[index][3].upper()} ({format.upper()} FORMAT)"))
+                    shown.append(index)
+                click.echo(text, nl=False)
+            
+            audit_tool.generate_changelists_with_ai(jobs, format, False, voice, on_delta=show)
+            click.echo("")
+            return
+        
+        changelists = audit_tool.generate_changelists_with_ai(jobs, format, False, voice)
+        
+        for (date, start_date, end_date, date_display, _), changelist_text in zip(reports, changelists):
+            report_title = f"CHANGELIST FOR {date_display.upper()} ({format.upper()} FORMAT)"
+            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, 'changelist', repository, author, audit_tool.login, format)
+            audit_tool.save_report_to_file(changelist_text, output_filename, report_title)
+            click.echo(f"{Fore.GREEN}Changelist saved to: {output_filename}{Style.RESET_ALL}")
+        
+    except Exception as e:
+        click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
 @cli.command()
 @click.argument('repository')
 @click.option('--date', '-d', help='Date/range to analyze (YYYY-MM-DD, YYYY-MM-DD..YYYY-MM-DD, or keywords: today, yesterday, week, month, all, etc.). Default: today')
@@ -1579,16 +2625,9 @@ def changelist(repository, date, author, output, format, verbose, display_only,
 def hours(repository, date, author, output, format, save, min_commit, max_commit):
     """Calculate work hours for a specific date or date range."""
     
-    # Validate environment
-    validation_result = validate_environment()
-    if not validation_result:
-        sys.exit(1)
-    
-    _, github_token, openai_api_key = validation_result
-    
     try:
         # Initialize the tool
-        audit_tool = GitHubAuditTool(github_token, openai_api_key)
+        audit_tool = get_audit_tool()
         
         # Parse date range
         start_date, end_date = audit_tool.parse_date_range(date)
@@ -1611,125 +2650,55 @@ def hours(repository, date, author, output, format, save, min_commit, max_commit
             click.echo(f"{Fore.YELLOW}No commits found for {date_display}{Style.RESET_ALL}")
             return
         
-        # Calculate hours for entire range
-        total_hours, first_commit, last_commit, work_blocks = audit_tool.calculate_work_hours(commits)
+        # Collect the console output and write it in a single call
+        lines = [
+            f"\n{Fore.GREEN}{'='*60}",
+            f"WORK HOURS FOR {date_display.upper()}",
+            f"{'='*60}{Style.RESET_ALL}\n",
+        ]
+        report_content = None
         
         # For multi-day ranges, also break down by day
         if start_date.date() != end_date.date():
-            # Group commits by day
-            commits_by_day = defaultdict(list)
-            for commit in commits:
-                day = commit.commit.author.date.date()
-                commits_by_day[day].append(commit)
-            
-            # Display results
-            click.echo(f"\n{Fore.GREEN}{'='*60}")
-            click.echo(f"WORK HOURS FOR {date_display.upper()}")
-            click.echo(f"{'='*60}{Style.RESET_ALL}\n")
+            hours_by_day = audit_tool.calculate_work_hours_by_day(commits)
+            first_commit = min(commits, key=_by_timestamp).date
+            last_commit = max(commits, key=_by_timestamp).date
             
-            click.echo(f"{Fore.CYAN}Total commits: {len(commits)}{Style.RESET_ALL}")
-            click.echo(f"{Fore.CYAN}Date range: {first_commit.strftime('%Y-%m-%d %H:%M UTC')} - {last_commit.strftime('%Y-%m-%d %H:%M UTC')}{Style.RESET_ALL}")
+            lines.append(f"{Fore.CYAN}Total commits: {len(commits)}{Style.RESET_ALL}")
+            lines.append(f"{Fore.CYAN}Date range: {first_commit.strftime('%Y-%m-%d %H:%M UTC')} - {last_commit.strftime('%Y-%m-%d %H:%M UTC')}{Style.RESET_ALL}")
             
             # Daily breakdown
-            click.echo(f"\n{Fore.BLUE}Daily Breakdown:{Style.RESET_ALL}")
+            lines.append(f"\n{Fore.BLUE}Daily Breakdown:{Style.RESET_ALL}")
             daily_total = 0
-            for day in sorted(commits_by_day.keys()):
-                day_commits = commits_by_day[day]
-                day_hours, _, _, _ = audit_tool.calculate_work_hours(day_commits)
+            for day, (day_hours, day_commit_count) in hours_by_day.items():
                 daily_total += day_hours
-                day_name = day.strftime('%A')
+                day_name = _WEEKDAYS[day.weekday()]
                 hours_display = audit_tool._format_hours_display(day_hours)
-                click.echo(f"  {day.strftime('%Y-%m-%d')} ({day_name}): {hours_display} ({len(day_commits)} commits)")
+                lines.append(f"  {day.isoformat()} ({day_name}): {hours_display} ({day_commit_count} commits)")
             
             total_hours_display = audit_tool._format_hours_display(daily_total)
-            click.echo(f"\n{Fore.GREEN}📊 Total estimated hours worked: {total_hours_display}{Style.RESET_ALL}")
+            lines.append(f"\n{Fore.GREEN}📊 Total estimated hours worked: {total_hours_display}{Style.RESET_ALL}")
             
         else:
-            # Single day analysis
-            if output_format.lower() == 'markdown':
-                lines.append(f"## Summary")
-                lines.append(f"- **Total commits:** {len(commits)}")
-                lines.append(f"- **First commit:** {first_commit.strftime('%H:%M:%S UTC')}")
-                lines.append(f"- **Last commit:** {last_commit.strftime('%H:%M:%S UTC')}")
-                lines.append("")
-                lines.append("## Commit Summary")
-                lines.append("")
-            else:
-                lines.append(f"Total commits: {len(commits)}")
-                lines.append(f"First commit: {first_commit.strftime('%H:%M:%S UTC')}")
-                lines.append(f"Last commit:  {last_commit.strftime('%H:%M:%S UTC')}")
-                lines.append("")
-                lines.append("Commit Summary:")
-            
-            # Show commit summary (limit to last 20 commits for readability)
-            commits_to_show = commits[-20:]
-            start_index = len(commits) - len(commits_to_show) + 1
-            
-            if len(commits) > 20:
-                if output_format.lower() == 'markdown':
-                    lines.append("_(showing last 20 of {} commits)_".format(len(commits)))
-                else:
-                    lines.append(f"  ... (showing last 20 of {len(commits)} commits)")
-            
-            for i, commit in enumerate(commits_to_show, start_index):
-                timestamp = commit.commit.author.date.strftime('%H:%M')
-                message = commit.commit.message.split('\n')[0][:60]
-                
-                if output_format.lower() == 'markdown':
-                    lines.append(f"{i}. **{timestamp}** - {message}")
-                else:
-                    lines.append(f"  {i:2d}. {timestamp} - {message}")
-            
-            lines.append("")
-            
-            # Work blocks analysis
-            if output_format.lower() == 'markdown':
-                lines.append(f"## Work Blocks Analysis")
-                lines.append(f"*{len(work_blocks)} blocks detected*")
-                lines.append("")
-            else:
-                lines.append(f"Work Blocks Analysis ({len(work_blocks)} blocks detected):")
-            
-            for i, block in enumerate(work_blocks, 1):
-                start_time = block['start'].strftime('%H:%M')
-                end_time = block['end'].strftime('%H:%M')
-                hours = block['hours']
-                commit_count = block['commits']
-                hours_display = audit_tool._format_hours_display(hours)
-                
-                if start_time == end_time:
-                    if output_format.lower() == 'markdown':
-                        lines.append(f"- **Block {i}:** {start_time} (isolated commit - {hours_display})")
-                    else:
-                        lines.append(f"  Block {i}: {start_time} (isolated commit - {hours_display})")
-                else:
-                    if output_format.lower() == 'markdown':
-                        lines.append(f"- **Block {i}:** {start_time} - {end_time} ({hours_display}, {commit_count} commits)")
-                    else:
-                        lines.append(f"  Block {i}: {start_time} - {end_time} ({hours_display}, {commit_count} commits)")
-            
-            lines.append("")
-            total_hours_display = audit_tool._format_hours_display(total_hours)
-            
-            if output_format.lower() == 'markdown':
-                lines.append(f"## Total")
-                lines.append(f"**📊 Total estimated hours worked:** {total_hours_display}")
-            else:
-                lines.append(f"📊 Total estimated hours worked: {total_hours_display}")
+            # Single day analysis uses the same layout as the saved report
+            report_content = audit_tool.format_hours_report(commits, date_display, start_date, end_date, format)
+            lines.append(report_content)
+        
+        click.echo("\n".join(lines))
         
         # Save to file if requested
         if output is not None:
             # Custom filename provided
-            report_content = audit_tool.format_hours_report(commits, date_display, start_date, end_date, format)
+            report_content = report_content or audit_tool.format_hours_report(commits, date_display, start_date, end_date, format)
             report_title = f"WORK HOURS FOR {date_display.upper()} ({format.upper()} FORMAT)"
             audit_tool.save_report_to_file(report_content, output, report_title)
             click.echo(f"\n{Fore.GREEN}Hours report saved to: {output}{Style.RESET_ALL}")
         elif save:
             # Auto-generate filename when --save flag is used
-            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, 'hours', repository, author, audit_tool.user.login, format)
+            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, 'hours', repository, author, audit_tool.login, format)
             click.echo(f"{Fore.CYAN}Auto-generated filename: {output_filename}{Style.RESET_ALL}")
             
-            report_content = audit_tool.format_hours_report(commits, date_display, start_date, end_date, format)
+            report_content = report_content or audit_tool.format_hours_report(commits, date_display, start_date, end_date, format)
             report_title = f"WORK HOURS FOR {date_display.upper()} ({format.upper()} FORMAT)"
             audit_tool.save_report_to_file(report_content, output_filename, report_title)
             click.echo(f"\n{Fore.GREEN}Hours report saved to: {output_filename}{Style.RESET_ALL}")
@@ -1738,6 +2707,138 @@ def hours(repository, date, author, output, format, save, min_commit, max_commit
         click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
         sys.exit(1)
 
+@cli.command()
+@click.argument('repository')
+@click.option('--date', '-d', help='Date/range to analyze (YYYY-MM-DD, YYYY-MM-DD..YYYY-MM-DD, or keywords: today, yesterday, week, month, all, etc.). Default: today')
+@click.option('--author', '-a', help='Specific author to filter commits. Default: authenticated user')
+@click.option('--format', '-f', type=click.Choice(['text', 'markdown'], case_sensitive=False), 
+              default='markdown', help='Output format: text (plain text) or markdown. Default: markdown')
+@click.option('--verbose', '-v', is_flag=True, help='Include full diffs in the changelist (may use more tokens). Default: commit messages only')
+@click.option('--display-only', is_flag=True, help='Display output only (do not save to files)')
+@click.option('--voice', help='Specify the tone/voice for the changelist (e.g., "friendly and upbeat", "formal and concise", "enthusiastic")')
+@click.option('--min-commit', help='Start analysis from this commit SHA (earliest commit to include)')
+@click.option('--max-commit', help='Stop analysis at this commit SHA (latest commit to include)')
+@click.option('--timeline', 'with_timeline', is_flag=True, help='Also generate the AI development timeline, requested alongside the changelist')
+def report(repository, date, author, format, verbose, display_only, voice, min_commit, max_commit, with_timeline):
+    """Generate the changelist and the hours report together.
+    
+    Commits are listed once for all reports, and the AI changelist (plus the
+    timeline with --timeline) is generated in the background while the hours
+    are calculated. The reports are saved to auto-generated files unless
+    --display-only is given.
+    """
+    
+    try:
+        # Initialize the tool
+        audit_tool = get_audit_tool()
+        
+        # Parse date range
+        start_date, end_date = audit_tool.parse_date_range(date)
+        
+        # Format date range for display
+        if start_date.date() == end_date.date():
+            date_display = start_date.strftime('%Y-%m-%d')
+        else:
+            date_display = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+        
+        # Get repository
+        click.echo(f"{Fore.BLUE}Analyzing repository: {repository}{Style.RESET_ALL}")
+        repo = audit_tool.get_repository(repository)
+        
+        # Get commits for the date range
+        click.echo(f"{Fore.BLUE}Getting commits for {date_display}...{Style.RESET_ALL}")
+        commits = audit_tool.get_commits_for_date_range(repo, start_date, end_date, author, min_commit, max_commit)
+        
+        if not commits:
+            click.echo(f"{Fore.YELLOW}No commits found for {date_display}{Style.RESET_ALL}")
+            return
+        
+        click.echo(f"{Fore.GREEN}Found {len(commits)} commits{Style.RESET_ALL}")
+        
+        # Start the changelist first; the hours are calculated while it is generated
+        ai_reports = "changelist and timeline" if with_timeline else "changelist"
+        click.echo(f"{Fore.BLUE}Generating AI {ai_reports} ({format} format){' from full diffs' if verbose else ''}...{Style.RESET_ALL}")
+        reports_future = audit_tool.generate_reports_for_commits_async(commits, (start_date, end_date), format, verbose, voice, with_timeline)
+        hours_text = audit_tool.format_hours_report(commits, date_display, start_date, end_date, format)
+        changelist_text, timeline_text = reports_future.result()
+        
+        reports = [
+            ('hours', f"WORK HOURS FOR {date_display.upper()} ({format.upper()} FORMAT)", hours_text),
+            ('changelist', f"CHANGELIST FOR {date_display.upper()} ({format.upper()} FORMAT)", changelist_text),
+        ]
+        if with_timeline:
+            reports.append(('timeline', f"DEVELOPMENT TIMELINE FOR {date_display.upper()} ({format.upper()} FORMAT)", timeline_text))
+        
+        if display_only:
+            lines = []
+            for _, title, text in reports:
+                lines.extend([f"\n{Fore.GREEN}{'='*60}", title, f"{'='*60}{Style.RESET_ALL}\n", text])
+            click.echo("\n".join(lines))
+            return
+        
+        for report_type, title, text in reports:
+            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, report_type, repository, author, audit_tool.login, format)
+            audit_tool.save_report_to_file(text, output_filename, title)
+            click.echo(f"{Fore.GREEN}{report_type.capitalize()} report saved to: {output_filename}{Style.RESET_ALL}")
+        
+    except Exception as e:
+        click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
+@cli.command()
+@click.argument('repositories', nargs=-1, required=True)
+@click.option('--date', '-d', help='Date/range to analyze (YYYY-MM-DD, YYYY-MM-DD..YYYY-MM-DD, or keywords: today, yesterday, week, month, all, etc.). Default: today')
+@click.option('--author', '-a', help='Specific author to filter commits. Default: authenticated user')
+def multi(repositories, date, author):
+    """Calculate work hours across several repositories at once.
+    
+    Commits for all repositories are listed with one batched GraphQL query.
+    Hours are shown per repository, and the total is calculated over the
+    combined timeline so overlapping work in different repositories is not
+    counted twice.
+    """
+    
+    try:
+        # Initialize the tool
+        audit_tool = get_audit_tool()
+        
+        # Parse date range
+        start_date, end_date = audit_tool.parse_date_range(date)
+        
+        # Format date range for display
+        if start_date.date() == end_date.date():
+            date_display = start_date.strftime('%Y-%m-%d')
+        else:
+            date_display = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+        
+        click.echo(f"{Fore.BLUE}Getting commits for {len(repositories)} repositories for {date_display}...{Style.RESET_ALL}")
+        commits_by_repo = audit_tool.get_commits_for_repositories(list(repositories), start_date, end_date, author)
+        all_commits = [commit for commits in commits_by_repo.values() for commit in commits]
+        
+        if not all_commits:
+            click.echo(f"{Fore.YELLOW}No commits found for {date_display}{Style.RESET_ALL}")
+            return
+        
+        lines = [
+            f"\n{Fore.GREEN}{'='*60}",
+            f"WORK HOURS ACROSS {len(commits_by_repo)} REPOSITORIES FOR {date_display.upper()}",
+            f"{'='*60}{Style.RESET_ALL}\n",
+        ]
+        for full_name, commits in commits_by_repo.items():
+            if commits:
+                repo_hours, _, _, _ = audit_tool.calculate_work_hours(commits)
+                lines.append(f"  {full_name}: {audit_tool._format_hours_display(repo_hours)} ({len(commits)} commits)")
+            else:
+                lines.append(f"  {full_name}: no commits")
+        
+        total_hours, _, _, _ = audit_tool.calculate_work_hours(all_commits)
+        lines.append(f"\n{Fore.GREEN}📊 Total estimated hours worked: {audit_tool._format_hours_display(total_hours)} ({len(all_commits)} commits){Style.RESET_ALL}")
+        click.echo("\n".join(lines))
+        
+    except Exception as e:
+        click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
 @cli.command()
 @click.argument('repository')
 @click.option('--date', '-d', help='Date/range to analyze (YYYY-MM-DD, YYYY-MM-DD..YYYY-MM-DD, or keywords: today, yesterday, week, month, all, etc.). Default: this week')
@@ -1751,20 +2852,13 @@ def hours(repository, date, author, output, format, save, min_commit, max_commit
 def rhythm(repository, date, author, output, format, save, min_commit, max_commit):
     """Analyze coding rhythm and patterns for a date range."""
     
-    # Validate environment
-    validation_result = validate_environment()
-    if not validation_result:
-        sys.exit(1)
-    
-    _, github_token, openai_api_key = validation_result
-    
     # Default to current week if no date specified
     if not date:
         date = 'this-week'
     
     try:
         # Initialize the tool
-        audit_tool = GitHubAuditTool(github_token, openai_api_key)
+        audit_tool = get_audit_tool()
         
         # Parse date range
         start_date, end_date = audit_tool.parse_date_range(date)
@@ -1791,93 +2885,91 @@ def rhythm(repository, date, author, output, format, save, min_commit, max_commi
         click.echo(f"{Fore.BLUE}Analyzing coding patterns...{Style.RESET_ALL}")
         rhythm_data = audit_tool.analyze_coding_rhythm(commits)
         
-        # Display results
-        click.echo(f"\n{Fore.GREEN}{'='*60}")
-        click.echo(f"CODING RHYTHM ANALYSIS FOR {date_display.upper()}")
-        click.echo(f"{'='*60}{Style.RESET_ALL}\n")
+        # Display results, collected and written in one go
+        lines = [
+            f"\n{Fore.GREEN}{'='*60}",
+            f"CODING RHYTHM ANALYSIS FOR {date_display.upper()}",
+            f"{'='*60}{Style.RESET_ALL}\n",
+        ]
         
         # Summary stats
-        click.echo(f"{Fore.CYAN}📊 Summary:{Style.RESET_ALL}")
-        click.echo(f"  Total commits: {rhythm_data['total_commits']}")
-        click.echo(f"  Active days: {rhythm_data['total_days']}")
-        click.echo(f"  Avg commits/day: {rhythm_data['avg_commits_per_day']:.1f}")
+        lines.append(f"{Fore.CYAN}📊 Summary:{Style.RESET_ALL}")
+        lines.append(f"  Total commits: {rhythm_data['total_commits']}")
+        lines.append(f"  Active days: {rhythm_data['total_days']}")
+        lines.append(f"  Avg commits/day: {rhythm_data['avg_commits_per_day']:.1f}")
         
         if rhythm_data['date_range']:
             start_date_analysis, end_date_analysis = rhythm_data['date_range']
-            click.echo(f"  Analysis period: {start_date_analysis} to {end_date_analysis}")
+            lines.append(f"  Analysis period: {start_date_analysis} to {end_date_analysis}")
         
         # Peak times
         peak_hour, peak_commits = rhythm_data['peak_hour']
         peak_day, peak_day_commits = rhythm_data['peak_day']
-        click.echo(f"\n{Fore.CYAN}🚀 Peak Activity:{Style.RESET_ALL}")
-        click.echo(f"  Most productive hour: {peak_hour:02d}:00 ({peak_commits} commits)")
-        click.echo(f"  Most productive day: {peak_day} ({peak_day_commits} commits)")
-        click.echo(f"  Work span: {rhythm_data['earliest_hour']:02d}:00 - {rhythm_data['latest_hour']:02d}:00 ({rhythm_data['work_span_hours']} hours)")
+        lines.append(f"\n{Fore.CYAN}🚀 Peak Activity:{Style.RESET_ALL}")
+        lines.append(f"  Most productive hour: {peak_hour:02d}:00 ({peak_commits} commits)")
+        lines.append(f"  Most productive day: {peak_day} ({peak_day_commits} commits)")
+        lines.append(f"  Work span: {rhythm_data['earliest_hour']:02d}:00 - {rhythm_data['latest_hour']:02d}:00 ({rhythm_data['work_span_hours']} hours)")
         
         # Hourly breakdown
-        click.echo(f"\n{Fore.BLUE}⏰ Hourly Commit Pattern:{Style.RESET_ALL}")
+        lines.append(f"\n{Fore.BLUE}⏰ Hourly Commit Pattern:{Style.RESET_ALL}")
         hourly_commits = rhythm_data['hourly_commits']
-        max_hourly = max(hourly_commits.values()) if hourly_commits else 1
+        max_hourly = rhythm_data['peak_hour'][1] or 1
         
-        for hour in range(24):
-            count = hourly_commits.get(hour, 0)
-            if count > 0:
-                # Create a simple bar chart
-                bar_length = int((count / max_hourly) * 20)
-                bar = '█' * bar_length
-                click.echo(f"  {hour:02d}:00 │{bar:<20}│ {count} commits")
+        for hour, count in sorted(hourly_commits.items()):
+            # Create a simple bar chart
+            bar = _bar(count, max_hourly, 20)
+            lines.append(f"  {hour:02d}:00 │{bar:<20}│ {count} commits")
         
         # Daily breakdown
-        click.echo(f"\n{Fore.BLUE}📅 Weekly Commit Pattern:{Style.RESET_ALL}")
+        lines.append(f"\n{Fore.BLUE}📅 Weekly Commit Pattern:{Style.RESET_ALL}")
         daily_commits = rhythm_data['daily_commits']
         daily_hours = rhythm_data['daily_hours']
         
-        # Ordered days of week
-        days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        max_daily = max(daily_commits.values()) if daily_commits else 1
+        max_daily = rhythm_data['peak_day'][1] or 1
         
-        for day in days_order:
+        for day in _WEEKDAYS:
             commits_count = daily_commits.get(day, 0)
             hours_count = daily_hours.get(day, 0)
             if commits_count > 0:
-                bar_length = int((commits_count / max_daily) * 15)
-                bar = '█' * bar_length
+                bar = _bar(commits_count, max_daily, 15)
                 hours_display = audit_tool._format_hours_display(hours_count)
-                click.echo(f"  {day:<9} │{bar:<15}│ {commits_count} commits ({hours_display})")
+                lines.append(f"  {day:<9} │{bar:<15}│ {commits_count} commits ({hours_display})")
             else:
-                click.echo(f"  {day:<9} │{'':<15}│ 0 commits")
+                lines.append(f"  {day:<9} │{'':<15}│ 0 commits")
         
         # Productivity insights
-        click.echo(f"\n{Fore.YELLOW}💡 Insights:{Style.RESET_ALL}")
+        lines.append(f"\n{Fore.YELLOW}💡 Insights:{Style.RESET_ALL}")
         
         # Find most productive time blocks
         if hourly_commits:
             productive_hours = [h for h, c in hourly_commits.items() if c >= max_hourly * 0.7]
             if productive_hours:
                 if len(productive_hours) == 1:
-                    click.echo(f"  • You're most focused around {productive_hours[0]:02d}:00")
+                    lines.append(f"  • You're most focused around {productive_hours[0]:02d}:00")
                 else:
                     start_hour = min(productive_hours)
                     end_hour = max(productive_hours)
-                    click.echo(f"  • Your peak productivity window is {start_hour:02d}:00-{end_hour:02d}:00")
+                    lines.append(f"  • Your peak productivity window is {start_hour:02d}:00-{end_hour:02d}:00")
         
         # Analyze work pattern
         if rhythm_data['work_span_hours'] <= 4:
-            click.echo(f"  • You have a focused work pattern (4-hour span)")
+            lines.append(f"  • You have a focused work pattern (4-hour span)")
         elif rhythm_data['work_span_hours'] <= 8:
-            click.echo(f"  • You maintain steady productivity throughout the day")
+            lines.append(f"  • You maintain steady productivity throughout the day")
         else:
-            click.echo(f"  • You code across long hours - consider work-life balance")
+            lines.append(f"  • You code across long hours - consider work-life balance")
         
         # Weekly pattern insights
-        weekday_commits = sum(daily_commits.get(day, 0) for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'])
-        weekend_commits = sum(daily_commits.get(day, 0) for day in ['Saturday', 'Sunday'])
+        weekday_commits = sum(daily_commits.get(day, 0) for day in _WORKDAYS)
+        weekend_commits = sum(daily_commits.get(day, 0) for day in _WEEKEND)
         
         if weekend_commits > weekday_commits * 0.3:
-            click.echo(f"  • High weekend activity detected - {weekend_commits} weekend commits")
+            lines.append(f"  • High weekend activity detected - {weekend_commits} weekend commits")
         
         if daily_commits.get('Monday', 0) > max_daily * 0.8:
-            click.echo(f"  • Strong Monday momentum - you start weeks well!")
+            lines.append(f"  • Strong Monday momentum - you start weeks well!")
+        
+        click.echo("\n".join(lines))
         
         # Save to file if requested
         if output is not None:
@@ -1888,7 +2980,7 @@ def rhythm(repository, date, author, output, format, save, min_commit, max_commi
             click.echo(f"\n{Fore.GREEN}Rhythm analysis saved to: {output}{Style.RESET_ALL}")
         elif save:
             # Auto-generate filename when --save flag is used
-            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, 'rhythm', repository, author, audit_tool.user.login, format)
+            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, 'rhythm', repository, author, audit_tool.login, format)
             click.echo(f"{Fore.CYAN}Auto-generated filename: {output_filename}{Style.RESET_ALL}")
             
             report_content = audit_tool.format_rhythm_report(rhythm_data, date_display, format)
@@ -1912,27 +3004,21 @@ def rhythm(repository, date, author, output, format, save, min_commit, max_commi
 @click.option('--voice', help='Specify the tone/voice for the timeline (e.g., "narrative storytelling", "technical documentation", "executive summary")')
 @click.option('--min-commit', help='Start analysis from this commit SHA (earliest commit to include)')
 @click.option('--max-commit', help='Stop analysis at this commit SHA (latest commit to include)')
-def timeline(repository, date, author, output, format, verbose, display_only, voice, min_commit, max_commit):
+@click.option('--ai-threshold', type=int, default=0, help='Write a plain summary locally instead of calling the AI when the commit data is under this many tokens and no --voice is given. Default: 0 (always use the AI)')
+def timeline(repository, date, author, output, format, verbose, display_only, voice, min_commit, max_commit, ai_threshold):
     """Generate an AI-powered development timeline showing chronological project evolution.
     
     By default, saves to an auto-generated markdown file to prevent wasting AI tokens.
     Use --display-only to show output without saving.
     """
     
-    # Validate environment
-    validation_result = validate_environment()
-    if not validation_result:
-        sys.exit(1)
-    
-    _, github_token, openai_api_key = validation_result
-    
     # Default to current week if no date specified
     if not date:
         date = 'this-week'
     
     try:
         # Initialize the tool
-        audit_tool = GitHubAuditTool(github_token, openai_api_key)
+        audit_tool = get_audit_tool()
         
         # Parse date range
         start_date, end_date = audit_tool.parse_date_range(date)
@@ -1965,12 +3051,12 @@ def timeline(repository, date, author, output, format, verbose, display_only, vo
             click.echo(f"{Fore.GREEN}Found {len(commits)} commits{Style.RESET_ALL}")
         
         # Sort commits chronologically (oldest first) for timeline
-        commits = sorted(commits, key=lambda c: c.commit.author.date)
+        commits = sorted(commits, key=_by_timestamp)
         
         # Get commit data based on verbose flag
         if verbose:
             click.echo(f"{Fore.BLUE}Extracting full diffs...{Style.RESET_ALL}")
-            diffs, within_limit = audit_tool.get_commit_diffs(commits)
+            diffs, within_limit = audit_tool.get_commit_diffs_async(commits).result()
             
             if not within_limit:
                 click.echo(f"{Fore.YELLOW}Warning: Full diffs exceed token limit (>100k tokens). Falling back to commit messages only.{Style.RESET_ALL}")
@@ -1985,7 +3071,7 @@ def timeline(repository, date, author, output, format, verbose, display_only, vo
             is_full_diff = False
         
         # Check token count
-        token_count = audit_tool.count_tokens(commit_data)
+        token_count = audit_tool.count_tokens(commit_data, limit=128000)
         if token_count > 128000:  # 128k token limit
             click.echo(f"{Fore.RED}Error: Commit data ({token_count:,} tokens) exceeds maximum limit (128k tokens).{Style.RESET_ALL}")
             click.echo(f"{Fore.YELLOW}Try using a smaller date range or fewer commits.{Style.RESET_ALL}")
@@ -1993,17 +3079,18 @@ def timeline(repository, date, author, output, format, verbose, display_only, vo
         
         click.echo(f"{Fore.BLUE}Using {token_count:,} tokens ({('full diffs' if is_full_diff else 'commit messages only')})...{Style.RESET_ALL}")
         
-        # Generate AI timeline with specified format
-        click.echo(f"{Fore.BLUE}Generating AI development timeline ({format} format)...{Style.RESET_ALL}")
-        timeline_text = audit_tool.generate_timeline_with_ai(commit_data, (start_date, end_date), format, is_full_diff, voice)
+        if token_count >= ai_threshold or voice:
+            # Generate AI timeline with specified format
+            click.echo(f"{Fore.BLUE}Generating AI development timeline ({format} format)...{Style.RESET_ALL}")
+            timeline_text = audit_tool.generate_timeline_with_ai(commit_data, (start_date, end_date), format, is_full_diff, voice)
+        else:
+            click.echo(f"{Fore.BLUE}Commit data is under {ai_threshold:,} tokens, writing a summary without the AI...{Style.RESET_ALL}")
+            timeline_text = audit_tool.format_commit_summary(commits, date_display, format)
         
         # Save to file by default, unless display-only is specified
         if display_only:
             # Display output only to console
-            click.echo(f"\n{Fore.GREEN}{'='*60}")
-            click.echo(f"DEVELOPMENT TIMELINE FOR {date_display.upper()} ({format.upper()} FORMAT)")
-            click.echo(f"{'='*60}{Style.RESET_ALL}\n")
-            click.echo(timeline_text)
+            click.echo(_banner(f"DEVELOPMENT TIMELINE FOR {date_display.upper()} ({format.upper()} FORMAT)") + "\n" + timeline_text)
         elif output is not None:
             # Custom filename provided
             report_title = f"DEVELOPMENT TIMELINE FOR {date_display.upper()} ({format.upper()} FORMAT)"
@@ -2011,7 +3098,7 @@ def timeline(repository, date, author, output, format, verbose, display_only, vo
             click.echo(f"\n{Fore.GREEN}Timeline saved to: {output}{Style.RESET_ALL}")
         else:
             # Default behavior: Auto-generate filename and save
-            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, 'timeline', repository, author, audit_tool.user.login, format)
+            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, 'timeline', repository, author, audit_tool.login, format)
             click.echo(f"{Fore.CYAN}Auto-generated filename: {output_filename}{Style.RESET_ALL}")
             
             report_title = f"DEVELOPMENT TIMELINE FOR {date_display.upper()} ({format.upper()} FORMAT)"
@@ -2043,20 +3130,13 @@ def stats(repository, date, author, output, format, save, min_commit, max_commit
     work hours, activity streaks, file changes, and productivity insights.
     """
     
-    # Validate environment
-    validation_result = validate_environment()
-    if not validation_result:
-        sys.exit(1)
-    
-    _, github_token, openai_api_key = validation_result
-    
     # Default to current month if no date specified
     if not date:
         date = 'this-month'
     
     try:
         # Initialize the tool
-        audit_tool = GitHubAuditTool(github_token, openai_api_key)
+        audit_tool = get_audit_tool()
         
         # Parse date range
         start_date, end_date = audit_tool.parse_date_range(date)
@@ -2084,9 +3164,7 @@ def stats(repository, date, author, output, format, save, min_commit, max_commit
         stats_data = audit_tool.analyze_repository_stats(repo, commits, start_date, end_date)
         
         # Display results
-        click.echo(f"\n{Fore.GREEN}{'='*60}")
-        click.echo(f"REPOSITORY STATISTICS FOR {date_display.upper()}")
-        click.echo(f"{'='*60}{Style.RESET_ALL}\n")
+        click.echo(_banner(f"REPOSITORY STATISTICS FOR {date_display.upper()}"))
         
         # Basic summary for console
         click.echo(f"{Fore.CYAN}📊 Quick Summary:{Style.RESET_ALL}")
@@ -2108,7 +3186,7 @@ def stats(repository, date, author, output, format, save, min_commit, max_commit
         
         # Show top file types
         if stats_data['file_types']:
-            top_types = sorted(stats_data['file_types'].items(), key=lambda x: x[1], reverse=True)[:3]
+            top_types = stats_data['file_types_top'][:3]
             types_str = ', '.join([f".{ext} ({count})" for ext, count in top_types])
             click.echo(f"  📁 Top File Types: {types_str}")
         
@@ -2130,7 +3208,7 @@ def stats(repository, date, author, output, format, save, min_commit, max_commit
             click.echo(f"\n{Fore.GREEN}Statistics report saved to: {output}{Style.RESET_ALL}")
         elif save:
             # Auto-generate filename when --save flag is used
-            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, 'stats', repository, author, audit_tool.user.login, format)
+            output_filename = audit_tool.generate_smart_filename(date, start_date, end_date, 'stats', repository, author, audit_tool.login, format)
             click.echo(f"{Fore.CYAN}Auto-generated filename: {output_filename}{Style.RESET_ALL}")
             
             report_content = audit_tool.format_stats_report(stats_data, date_display, format)
@@ -2155,16 +3233,9 @@ def info(repository, date, author, min_commit, max_commit):
     Use this to identify which commit SHAs to use with --min-commit and --max-commit in other commands.
     """
     
-    # Validate environment
-    validation_result = validate_environment()
-    if not validation_result:
-        sys.exit(1)
-    
-    _, github_token, openai_api_key = validation_result
-    
     try:
         # Initialize the tool
-        audit_tool = GitHubAuditTool(github_token, openai_api_key)
+        audit_tool = get_audit_tool()
         
         # Parse date range
         start_date, end_date = audit_tool.parse_date_range(date)
@@ -2188,7 +3259,7 @@ def info(repository, date, author, min_commit, max_commit):
             return
         
         # Sort commits chronologically (oldest first) to match how min/max commits work
-        sorted_commits = sorted(commits, key=lambda c: c.commit.author.date)
+        sorted_commits = sorted(commits, key=_by_timestamp)
         
         # Display header
         click.echo(f"\n{Fore.GREEN}{'='*90}")
@@ -2209,13 +3280,13 @@ def info(repository, date, author, min_commit, max_commit):
         
         # Display each commit
         for i, commit in enumerate(sorted_commits, 1):
-            commit_date = commit.commit.author.date
+            commit_date = commit.date
             date_str = commit_date.strftime('%Y-%m-%d')
-            time_str = commit_date.strftime('%H:%M:%S')
+            time_str = f"{commit_date.hour:02d}:{commit_date.minute:02d}:{commit_date.second:02d}"
             commit_sha = commit.sha[:8]
             
             # Get first line of commit message and truncate to 50 characters
-            message = commit.commit.message.split('\n')[0]
+            message = commit.message.partition('\n')[0]
             if len(message) > 47:
                 message = message[:47] + "..."
             
@@ -2250,11 +3321,7 @@ def setup():
     
     if os.path.exists(env_file):
         click.echo(f"{Fore.YELLOW}Found existing .env file. Current values will be shown.{Style.RESET_ALL}\n")
-        with open(env_file, 'r') as f:
-            for line in f:
-                if '=' in line and not line.strip().startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    env_vars[key] = value
+        env_vars = dotenv_values(env_file)
     
     # GitHub Token
     current_github = env_vars.get('GITHUB_TOKEN', '')
@@ -2276,6 +3343,93 @@ def setup():
     
     click.echo(f"\n{Fore.GREEN}Configuration saved to .env file!{Style.RESET_ALL}")
     click.echo(f"{Fore.YELLOW}Make sure to add .env to your .gitignore file to keep your keys secure.{Style.RESET_ALL}")
+    
+    # Try both credentials at once so a bad one shows up now rather than on the first real run
+    click.echo(f"\n{Fore.BLUE}Verifying credentials...{Style.RESET_ALL}")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        github_check = pool.submit(lambda: Github(github_token).get_user().login)
+        openai_check = pool.submit(lambda: OpenAI(api_key=openai_key).models.list())
+    
+    try:
+        click.echo(f"{Fore.GREEN}GitHub token OK (authenticated as {github_check.result()}){Style.RESET_ALL}")
+    except Exception as e:
+        click.echo(f"{Fore.RED}GitHub token check failed: {e}{Style.RESET_ALL}")
+    
+    try:
+        openai_check.result()
+        click.echo(f"{Fore.GREEN}OpenAI API key OK{Style.RESET_ALL}")
+    except Exception as e:
+        click.echo(f"{Fore.RED}OpenAI API key check failed: {e}{Style.RESET_ALL}")
+
+def _send_frame(channel, frame: Dict):
+    """Write one JSON frame to the worker's output channel."""
+    channel.write(json.dumps(frame) + "\n")
+    channel.flush()
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that wraps everything written to it in JSON output frames."""
+    
+    encoding = 'utf-8'
+    
+    def __init__(self, channel):
+        super().__init__()
+        self.channel = channel
+    
+    def writable(self):
+        return True
+    
+    def write(self, text):
+        # Reject bytes so click treats this as a text stream
+        if not isinstance(text, str):
+            raise TypeError("_FrameWriter only accepts text")
+        if text:
+            _send_frame(self.channel, {'type': 'output', 'text': text})
+        return len(text)
+    
+    def isatty(self):
+        return False
+
+@cli.command(hidden=True)
+def serve():
+    """Run as a long-lived worker, reading JSON commands from stdin.
+    
+    Each input line is {"args": [...]} holding the arguments for one command.
+    Its output is sent back as {"type": "output", "text": ...} frames,
+    followed by a single {"type": "done", "exit_code": ...} frame.
+    """
+    channel = sys.stdout
+    writer = _FrameWriter(channel)
+    
+    # Share one audit tool (and its caches) across commands when the keys are available
+    audit_tool = None
+    with redirect_stdout(io.StringIO()):
+        credentials = validate_environment()
+    if credentials is not None:
+        try:
+            audit_tool = GitHubAuditTool(*credentials)
+        except Exception:
+            audit_tool = None
+    
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        
+        exit_code = 0
+        with redirect_stdout(writer), redirect_stderr(writer):
+            try:
+                request = json.loads(line)
+                cli.main(args=request['args'], prog_name='github_audit_tool.py',
+                         obj={'audit_tool': audit_tool}, standalone_mode=False)
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except click.ClickException as e:
+                e.show()
+                exit_code = e.exit_code
+            except Exception as e:
+                click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+                exit_code = 1
+        
+        _send_frame(channel, {'type': 'done', 'exit_code': exit_code})
 
 if __name__ == '__main__':
     cli() 
\ No newline at end of file
@@ -20,7 +20,8 @@ def check_dependencies():
         'python-dotenv',
         'python-dateutil',
         'pytz',
-        'tiktoken'
+        'tiktoken',
+        'orjson'
     ]
     
     missing_modules = []
@@ -45,6 +46,8 @@ def check_dependencies():
                 import pytz
             elif module == 'tiktoken':
                 import tiktoken
+            elif module == 'orjson':
+                import orjson
         except ImportError:
             missing_modules.append(module)
     